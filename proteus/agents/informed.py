@@ -7,7 +7,40 @@ from proteus.core.events import Event, EventType, OrderIntent, Side
 
 
 def _clip01(value: float) -> float:
-    return min(1.0, max(0.0, value))
+    # Comparison chain instead of min/max calls; NaN still maps to 0.0.
+    if 0.0 <= value <= 1.0:
+        return value
+    return 1.0 if value > 1.0 else 0.0
+
+
+def _decide(
+    signal: float,
+    best_bid: float,
+    best_ask: float,
+    threshold: float,
+    min_size: float,
+    max_size: float,
+    size_slope: float,
+) -> tuple[Side, float, float] | None:
+    """
+    Pure decision kernel: thresholded side choice plus edge-scaled size.
+
+    Operates on plain floats so the per-tick path avoids attribute lookups.
+    """
+
+    buy_edge = signal - best_ask
+    sell_edge = best_bid - signal
+    if buy_edge <= threshold and sell_edge <= threshold:
+        return None
+
+    if buy_edge >= sell_edge:
+        side, price, net_edge = Side.BUY, best_ask, buy_edge - threshold
+    else:
+        side, price, net_edge = Side.SELL, best_bid, sell_edge - threshold
+
+    raw = min_size + (size_slope * (net_edge if net_edge > 0.0 else 0.0))
+    size = max_size if raw > max_size else (min_size if raw < min_size else raw)
+    return side, price, size
 
 
 class InformedTraderAgent(Agent):
@@ -27,12 +60,15 @@ class InformedTraderAgent(Agent):
         size_slope: float = 20.0,
     ) -> None:
         self.agent_id = agent_id
+        self._id_prefix = f"{agent_id}-"  # intent ids are "<agent>-<ts>-<seq>"
         self._theta = theta
         self._fee_bps = fee_bps
         self._latency_penalty = latency_penalty
         self._min_size = min_size
         self._max_size = max_size
         self._size_slope = size_slope
+        # Entry threshold is fixed for the agent's lifetime; fold it once.
+        self._threshold = self._theta + (self._fee_bps / 10_000.0) + self._latency_penalty
 
         self._signal: float | None = None
         self._best_bid: float | None = None
@@ -59,29 +95,25 @@ class InformedTraderAgent(Agent):
         if self._signal is None or self._best_bid is None or self._best_ask is None:
             return ()
 
-        threshold = self._theta + (self._fee_bps / 10_000.0) + self._latency_penalty
-
-        buy_edge = self._signal - self._best_ask
-        sell_edge = self._best_bid - self._signal
-
-        if buy_edge <= threshold and sell_edge <= threshold:
+        decision = _decide(
+            self._signal,
+            self._best_bid,
+            self._best_ask,
+            self._threshold,
+            self._min_size,
+            self._max_size,
+            self._size_slope,
+        )
+        if decision is None:
             return ()
 
-        if buy_edge >= sell_edge:
-            size = self._size_for_edge(buy_edge - threshold)
-            return (self._make_intent(ts_ms=ts_ms, side=Side.BUY, price=self._best_ask, size=size),)
-
-        size = self._size_for_edge(sell_edge - threshold)
-        return (self._make_intent(ts_ms=ts_ms, side=Side.SELL, price=self._best_bid, size=size),)
-
-    def _size_for_edge(self, net_edge: float) -> float:
-        raw = self._min_size + (self._size_slope * max(0.0, net_edge))
-        return min(self._max_size, max(self._min_size, raw))
+        side, price, size = decision
+        return (self._make_intent(ts_ms=ts_ms, side=side, price=price, size=size),)
 
     def _make_intent(self, *, ts_ms: int, side: Side, price: float, size: float) -> OrderIntent:
         self._intent_seq += 1
         return OrderIntent(
-            intent_id=f"{self.agent_id}-{ts_ms}-{self._intent_seq}",
+            intent_id=f"{self._id_prefix}{ts_ms}-{self._intent_seq}",
             agent_id=self.agent_id,
             ts_ms=ts_ms,
             side=side,
@@ -91,7 +123,10 @@ class InformedTraderAgent(Agent):
 
 
 def _extract_float(payload: dict, *keys: str) -> float | None:
+    # One dict probe per candidate key (missing and None values both skip).
+    get = payload.get
     for key in keys:
-        if key in payload and payload[key] is not None:
-            return float(payload[key])
+        value = get(key)
+        if value is not None:
+            return float(value)
     return None
@@ -7,7 +7,10 @@ from proteus.core.events import Event, EventType, OrderIntent, Side
 
 
 def _clip01(value: float) -> float:
-    return min(1.0, max(0.0, value))
+    # Comparison chain instead of min/max calls; NaN still maps to 0.0.
+    if 0.0 <= value <= 1.0:
+        return value
+    return 1.0 if value > 1.0 else 0.0
 
 
 class MarketMakerAgent(Agent):
@@ -34,6 +37,7 @@ class MarketMakerAgent(Agent):
         as_alpha: float = 0.2,
     ) -> None:
         self.agent_id = agent_id
+        self._id_prefix = f"{agent_id}-"  # intent ids are "<agent>-<ts>-<seq>"
         self._belief = _clip01(belief_init)
         self._inventory = 0.0
 
@@ -66,18 +70,18 @@ class MarketMakerAgent(Agent):
             return
 
         if event.event_type is EventType.FILL:
-            size = float(event.payload.get("size", 0.0) or 0.0)
-            fill_price = _extract_float(event.payload, "price")
+            payload = event.payload
+            size = float(payload.get("size", 0.0) or 0.0)
+            fill_price = _extract_float(payload, "price")
 
-            if event.payload.get("buy_agent_id") == self.agent_id:
+            is_buyer = payload.get("buy_agent_id") == self.agent_id
+            is_seller = not is_buyer and payload.get("sell_agent_id") == self.agent_id
+            if is_buyer:
                 self._inventory += size
-            elif event.payload.get("sell_agent_id") == self.agent_id:
+            elif is_seller:
                 self._inventory -= size
 
-            if fill_price is not None and (
-                event.payload.get("buy_agent_id") == self.agent_id
-                or event.payload.get("sell_agent_id") == self.agent_id
-            ):
+            if fill_price is not None and (is_buyer or is_seller):
                 as_sample = abs(self._belief - fill_price)
                 self._as_hat = ((1.0 - self._as_alpha) * self._as_hat) + (
                     self._as_alpha * as_sample
@@ -105,37 +109,32 @@ class MarketMakerAgent(Agent):
         size_scale = max(0.2, 1.0 - (abs(self._inventory) / max(self._max_inventory, 1e-9)))
         order_size = max(self._min_size, self._base_size * size_scale)
 
-        intents: list[OrderIntent] = []
-
         # At risk limit, quote only the inventory-reducing side
-        if self._inventory >= self._max_inventory:
-            ask = _clip01(reservation + half_spread)
-            intents.append(
-                self._make_intent(ts_ms=ts_ms, side=Side.SELL, price=ask, size=order_size)
-            )
-            return intents
-        if self._inventory <= -self._max_inventory:
-            bid = _clip01(reservation - half_spread)
-            intents.append(
-                self._make_intent(ts_ms=ts_ms, side=Side.BUY, price=bid, size=order_size)
-            )
-            return intents
+        quote_bid = self._inventory < self._max_inventory
+        quote_ask = not quote_bid or self._inventory > -self._max_inventory
 
         bid = _clip01(reservation - half_spread)
         ask = _clip01(reservation + half_spread)
-        if bid >= ask:
+        if quote_bid and quote_ask and bid >= ask:
             epsilon = min(self._min_half_spread, 0.001)
             bid = _clip01(reservation - epsilon)
             ask = _clip01(reservation + epsilon)
 
-        intents.append(self._make_intent(ts_ms=ts_ms, side=Side.BUY, price=bid, size=order_size))
-        intents.append(self._make_intent(ts_ms=ts_ms, side=Side.SELL, price=ask, size=order_size))
+        intents: list[OrderIntent] = []
+        if quote_bid:
+            intents.append(
+                self._make_intent(ts_ms=ts_ms, side=Side.BUY, price=bid, size=order_size)
+            )
+        if quote_ask:
+            intents.append(
+                self._make_intent(ts_ms=ts_ms, side=Side.SELL, price=ask, size=order_size)
+            )
         return intents
 
     def _make_intent(self, *, ts_ms: int, side: Side, price: float, size: float) -> OrderIntent:
         self._intent_seq += 1
         return OrderIntent(
-            intent_id=f"{self.agent_id}-{ts_ms}-{self._intent_seq}",
+            intent_id=f"{self._id_prefix}{ts_ms}-{self._intent_seq}",
             agent_id=self.agent_id,
             ts_ms=ts_ms,
             side=side,
@@ -148,21 +147,29 @@ class MarketMakerAgent(Agent):
         if self._last_mid is None:
             self._last_mid = mid
             return
+        if mid == self._last_mid:
+            # Stale mid: a zero-delta sample only decays the EMA, no need to refresh it.
+            self._sigma_hat = (1.0 - self._vol_alpha) * self._sigma_hat
+            return
         delta = abs(mid - self._last_mid)
         self._sigma_hat = ((1.0 - self._vol_alpha) * self._sigma_hat) + (self._vol_alpha * delta)
         self._last_mid = mid
 
 
 def _extract_float(payload: dict, *keys: str) -> float | None:
+    # One dict probe per candidate key (missing and None values both skip).
+    get = payload.get
     for key in keys:
-        if key in payload and payload[key] is not None:
-            return float(payload[key])
+        value = get(key)
+        if value is not None:
+            return float(value)
     return None
 
 
 def _extract_mid(payload: dict) -> float | None:
-    if "mid_price" in payload and payload["mid_price"] is not None:
-        return _clip01(float(payload["mid_price"]))
+    mid = payload.get("mid_price")
+    if mid is not None:
+        return _clip01(float(mid))
 
     bid = payload.get("best_bid")
     ask = payload.get("best_ask")
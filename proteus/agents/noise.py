@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from math import exp
+import hashlib
+from math import exp, floor, lgamma, log, sqrt
 from random import Random
 
 from proteus.agents.base import Agent
@@ -10,14 +11,16 @@ from proteus.core.events import Event, OrderIntent, Side
 
 
 def _clip01(value: float) -> float:
-    return min(1.0, max(0.0, value))
+    # Comparison chain instead of min/max calls; NaN still maps to 0.0.
+    if 0.0 <= value <= 1.0:
+        return value
+    return 1.0 if value > 1.0 else 0.0
 
 
 def _default_seed(agent_id: str) -> int:
-    acc = 17
-    for ch in agent_id:
-        acc = (acc * 131 + ord(ch)) & 0xFFFFFFFFFFFFFFFF
-    return acc
+    # Stable across processes/platforms (unlike hash()); one C call per agent id.
+    digest = hashlib.blake2b(agent_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=False)
 
 
 class NoiseTraderAgent(Agent):
@@ -25,6 +28,10 @@ class NoiseTraderAgent(Agent):
     Poisson-arrival random trader with bounded price/size draws.
     """
 
+    # Knuth's multiplicative sampler costs O(lam) draws; above this intensity
+    # switch to Hoermann's PTRS transformed rejection (O(1) expected draws).
+    _PTRS_MIN_LAM = 10.0
+
     def __init__(
         self,
         agent_id: str,
@@ -45,6 +52,7 @@ class NoiseTraderAgent(Agent):
             raise ValueError("price bounds must satisfy 0 <= low <= high <= 1")
 
         self.agent_id = agent_id
+        self._id_prefix = f"{agent_id}-"  # intent ids are "<agent>-<ts>-<seq>"
         self._arrival_rate = arrival_rate_per_second
         self._min_size = min_size
         self._max_size = max_size
@@ -74,24 +82,44 @@ class NoiseTraderAgent(Agent):
         dt_ms = self._dt_ms(ts_ms)
         lam = self._arrival_rate * (dt_ms / 1000.0)
         n_arrivals = self._poisson(lam)
-
+        if n_arrivals == 0:
+            return []
+
+        # Bind RNG draws once per batch; draw order (side, size, price) is unchanged.
+        rand = self._rng.random
+        uniform = self._rng.uniform
+        min_size = self._min_size
+        max_size = self._max_size
+        if self._best_bid is not None and self._best_ask is not None:
+            center = (self._best_bid + self._best_ask) / 2.0
+            low, high, clip = -self._price_jitter, self._price_jitter, True
+        else:
+            center, low, high, clip = 0.0, self._price_low, self._price_high, False
+
+        agent_id = self.agent_id
+        id_prefix = f"{self._id_prefix}{ts_ms}-"
+        seq = self._intent_seq
+        buy, sell = Side.BUY, Side.SELL
+        new_intent = OrderIntent
         intents: list[OrderIntent] = []
+        append = intents.append
         for _ in range(n_arrivals):
-            side = Side.BUY if self._rng.random() < 0.5 else Side.SELL
-            size = self._rng.uniform(self._min_size, self._max_size)
-            price = self._draw_price()
-
-            self._intent_seq += 1
-            intents.append(
-                OrderIntent(
-                    intent_id=f"{self.agent_id}-{ts_ms}-{self._intent_seq}",
-                    agent_id=self.agent_id,
-                    ts_ms=ts_ms,
-                    side=side,
-                    price=price,
-                    size=size,
+            side = buy if rand() < 0.5 else sell
+            size = uniform(min_size, max_size)
+            price = center + uniform(low, high)
+            seq += 1
+            # Positional args: (intent_id, agent_id, ts_ms, side, price, size).
+            append(
+                new_intent(
+                    f"{id_prefix}{seq}",
+                    agent_id,
+                    ts_ms,
+                    side,
+                    _clip01(price) if clip else price,
+                    size,
                 )
             )
+        self._intent_seq = seq
         return intents
 
     def _dt_ms(self, ts_ms: int) -> int:
@@ -102,15 +130,11 @@ class NoiseTraderAgent(Agent):
         self._last_ts_ms = ts_ms
         return max(1, dt)
 
-    def _draw_price(self) -> float:
-        if self._best_bid is not None and self._best_ask is not None:
-            mid = (self._best_bid + self._best_ask) / 2.0
-            return _clip01(mid + self._rng.uniform(-self._price_jitter, self._price_jitter))
-        return self._rng.uniform(self._price_low, self._price_high)
-
     def _poisson(self, lam: float) -> int:
         if lam <= 0.0:
             return 0
+        if lam >= self._PTRS_MIN_LAM:
+            return self._poisson_ptrs(lam)
         threshold = exp(-lam)
         k = 0
         p = 1.0
@@ -118,3 +142,28 @@ class NoiseTraderAgent(Agent):
             k += 1
             p *= self._rng.random()
         return k - 1
+
+    def _poisson_ptrs(self, lam: float) -> int:
+        """
+        Hoermann (1993) PTRS sampler, valid for lam >= 10.
+        """
+        rand = self._rng.random
+        log_lam = log(lam)
+        b = 0.931 + (2.53 * sqrt(lam))
+        a = -0.059 + (0.02483 * b)
+        log_inv_alpha = log(1.1239 + (1.1328 / (b - 3.4)))
+        v_r = 0.9277 - (3.6224 / (b - 2.0))
+        while True:
+            u = rand() - 0.5
+            v = rand()
+            us = 0.5 - abs(u)
+            if us <= 0.0:
+                continue
+            k = floor((((2.0 * a) / us) + b) * u + lam + 0.43)
+            if us >= 0.07 and v <= v_r:
+                return k
+            if k < 0 or (us < 0.013 and v > us) or v <= 0.0:
+                continue
+            accept_lhs = log(v) + log_inv_alpha - log((a / (us * us)) + b)
+            if accept_lhs <= -lam + (k * log_lam) - lgamma(k + 1):
+                return k
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from math import isfinite
 
@@ -33,6 +34,21 @@ class InvariantViolation:
     message: str
 
 
+# Violation code -> message template. Violations are stored column-wise as
+# (event_id, code index, offending value) and only rendered in snapshot().
+_VIOLATION_MESSAGES: dict[str, str] = {
+    "invalid_fill_price": "fill price must be within [0,1], got {}",
+    "invalid_fill_size": "fill size must be > 0, got {}",
+    "cash_transfer_not_zero_sum": "cash transfer drifted by {}",
+    "inventory_transfer_not_zero_sum": "inventory transfer drifted by {}",
+    "cash_conservation_violation": "total cash drifted by {}",
+    "inventory_conservation_violation": "total inventory drifted by {}",
+    "pnl_non_zero_sum": "settlement pnl sum drifted by {}",
+}
+_VIOLATION_CODES: tuple[str, ...] = tuple(_VIOLATION_MESSAGES)
+_VIOLATION_CODE_INDEX: dict[str, int] = {code: i for i, code in enumerate(_VIOLATION_CODES)}
+
+
 @dataclass
 class AccountingSnapshot:
     """
@@ -52,20 +68,36 @@ class AccountingEngine:
     """
 
     def __init__(self, *, tolerance: float = 1e-9) -> None:
-        self._accounts: dict[str, AgentAccount] = {}
-        self._violations: list[InvariantViolation] = []
+        # Column-wise ledger: row i of _cash/_inventory belongs to _agent_ids[i].
+        self._agent_index: dict[str, int] = {}
+        self._agent_ids: list[str] = []
+        self._cash: list[float] = []
+        self._inventory: list[float] = []
+        self._violation_event_ids: list[str] = []
+        self._violation_codes = array("B")
+        self._violation_values: list[float] = []
         self._processed_fills = 0
         self._last_fill_id: str | None = None
         self._tol = tolerance
+        # Ledger-wide totals maintained from per-fill deltas (no per-fill rescans).
+        self._total_cash = 0.0
+        self._total_inventory = 0.0
 
     def reset(self) -> None:
         """
         Clear all state
         """
-        self._accounts.clear()
-        self._violations.clear()
+        self._agent_index.clear()
+        self._agent_ids.clear()
+        self._cash.clear()
+        self._inventory.clear()
+        self._violation_event_ids.clear()
+        del self._violation_codes[:]
+        self._violation_values.clear()
         self._processed_fills = 0
         self._last_fill_id = None
+        self._total_cash = 0.0
+        self._total_inventory = 0.0
 
     def process_fill(self, fill: Fill) -> None:
         """
@@ -76,11 +108,17 @@ class AccountingEngine:
         if not self._validate_fill(fill):
             return
 
-        buyer = self._accounts.setdefault(fill.buy_agent_id, AgentAccount())
-        seller = self._accounts.setdefault(fill.sell_agent_id, AgentAccount())
+        # Steady state: both agents already have rows, so this is two dict probes.
+        index = self._agent_index
+        buyer = index.get(fill.buy_agent_id)
+        if buyer is None:
+            buyer = self._add_row(fill.buy_agent_id)
+        seller = index.get(fill.sell_agent_id)
+        if seller is None:
+            seller = self._add_row(fill.sell_agent_id)
 
-        prior_total_cash = self._total_cash()
-        prior_total_inventory = self._total_inventory()
+        prior_total_cash = self._total_cash
+        prior_total_inventory = self._total_inventory
 
         notional = fill.price * fill.size
         buyer_cash_delta = -notional
@@ -88,27 +126,82 @@ class AccountingEngine:
         buyer_inventory_delta = fill.size
         seller_inventory_delta = -fill.size
 
-        buyer.cash += buyer_cash_delta
-        seller.cash += seller_cash_delta
-        buyer.inventory += buyer_inventory_delta
-        seller.inventory += seller_inventory_delta
+        cash = self._cash
+        inventory = self._inventory
+        cash[buyer] += buyer_cash_delta
+        cash[seller] += seller_cash_delta
+        inventory[buyer] += buyer_inventory_delta
+        inventory[seller] += seller_inventory_delta
+        self._total_cash += buyer_cash_delta + seller_cash_delta
+        self._total_inventory += buyer_inventory_delta + seller_inventory_delta
         self._processed_fills += 1
 
         self._check_zero_sum_transfer(fill.fill_id, buyer_cash_delta, seller_cash_delta, "cash")
         self._check_zero_sum_transfer(
             fill.fill_id, buyer_inventory_delta, seller_inventory_delta, "inventory"
         )
-        self._check_conservation(fill.fill_id, prior_total_cash, self._total_cash(), "cash")
+        self._check_conservation(fill.fill_id, prior_total_cash, self._total_cash, "cash")
         self._check_conservation(
-            fill.fill_id, prior_total_inventory, self._total_inventory(), "inventory"
+            fill.fill_id, prior_total_inventory, self._total_inventory, "inventory"
         )
 
     def process_fills(self, fills: list[Fill]) -> AccountingSnapshot:
         """
         Apply many fills in-order
+
+        Batch form of process_fill with ledger columns and running totals held
+        in locals; invariant helpers are only entered when a check trips, so
+        recorded violations match per-fill processing exactly.
         """
-        for fill in fills:
-            self.process_fill(fill)
+        index = self._agent_index
+        cash = self._cash
+        inventory = self._inventory
+        tol = self._tol
+        total_cash = self._total_cash
+        total_inventory = self._total_inventory
+        processed = self._processed_fills
+        try:
+            for fill in fills:
+                fill_id = fill.fill_id
+                self._last_fill_id = fill_id
+                price = fill.price
+                size = fill.size
+                # Chained range checks also reject NaN/inf, mirroring _validate_fill.
+                if not (0.0 <= price <= 1.0 and 0.0 < size and isfinite(size)):
+                    self._validate_fill(fill)
+                    continue
+
+                buyer = index.get(fill.buy_agent_id)
+                if buyer is None:
+                    buyer = self._add_row(fill.buy_agent_id)
+                seller = index.get(fill.sell_agent_id)
+                if seller is None:
+                    seller = self._add_row(fill.sell_agent_id)
+
+                notional = price * size
+                cash[buyer] -= notional
+                cash[seller] += notional
+                inventory[buyer] += size
+                inventory[seller] -= size
+                cash_drift = -notional + notional
+                inventory_drift = size + -size
+                prior_total_cash = total_cash
+                prior_total_inventory = total_inventory
+                total_cash += cash_drift
+                total_inventory += inventory_drift
+                processed += 1
+
+                if abs(cash_drift) > tol or abs(inventory_drift) > tol:
+                    self._check_zero_sum_transfer(fill_id, -notional, notional, "cash")
+                    self._check_zero_sum_transfer(fill_id, size, -size, "inventory")
+                    self._check_conservation(fill_id, prior_total_cash, total_cash, "cash")
+                    self._check_conservation(
+                        fill_id, prior_total_inventory, total_inventory, "inventory"
+                    )
+        finally:
+            self._total_cash = total_cash
+            self._total_inventory = total_inventory
+            self._processed_fills = processed
         return self.snapshot()
 
     def mark_to_market(self, mark_price: float) -> dict[str, float]:
@@ -118,7 +211,8 @@ class AccountingEngine:
         if not isfinite(mark_price):
             raise ValueError("mark_price must be finite")
         return {
-            agent_id: account.equity(mark_price) for agent_id, account in self._accounts.items()
+            agent_id: cash + (inventory * mark_price)
+            for agent_id, cash, inventory in zip(self._agent_ids, self._cash, self._inventory)
         }
 
     def settlement_pnl(self, outcome: float) -> dict[str, float]:
@@ -131,13 +225,7 @@ class AccountingEngine:
         pnl = self.mark_to_market(outcome)
         total = sum(pnl.values())
         if abs(total) > self._tol:
-            self._violations.append(
-                InvariantViolation(
-                    event_id=self._last_fill_id or "no-fills",
-                    code="pnl_non_zero_sum",
-                    message=f"settlement pnl sum drifted by {total}",
-                )
-            )
+            self._record_violation(self._last_fill_id or "no-fills", "pnl_non_zero_sum", total)
         return pnl
 
     def snapshot(self) -> AccountingSnapshot:
@@ -146,38 +234,48 @@ class AccountingEngine:
         """
 
         accounts_copy = {
-            agent_id: AgentAccount(cash=account.cash, inventory=account.inventory)
-            for agent_id, account in self._accounts.items()
+            agent_id: AgentAccount(cash=cash, inventory=inventory)
+            for agent_id, cash, inventory in zip(self._agent_ids, self._cash, self._inventory)
         }
 
-        violations_copy = list(self._violations)
+        violations_copy = [
+            InvariantViolation(
+                event_id=event_id,
+                code=_VIOLATION_CODES[code],
+                message=_VIOLATION_MESSAGES[_VIOLATION_CODES[code]].format(value),
+            )
+            for event_id, code, value in zip(
+                self._violation_event_ids, self._violation_codes, self._violation_values
+            )
+        ]
         return AccountingSnapshot(
             accounts=accounts_copy,
-            total_cash=self._total_cash(),
-            total_inventory=self._total_inventory(),
+            total_cash=self._total_cash,
+            total_inventory=self._total_inventory,
             violations=violations_copy,
             processed_fills=self._processed_fills,
         )
 
+    def _add_row(self, agent_id: str) -> int:
+        row = len(self._agent_ids)
+        self._agent_index[agent_id] = row
+        self._agent_ids.append(agent_id)
+        self._cash.append(0.0)
+        self._inventory.append(0.0)
+        return row
+
+    def _record_violation(self, event_id: str, code: str, value: float) -> None:
+        self._violation_event_ids.append(event_id)
+        self._violation_codes.append(_VIOLATION_CODE_INDEX[code])
+        self._violation_values.append(value)
+
     def _validate_fill(self, fill: Fill) -> bool:
         if not isfinite(fill.price) or fill.price < 0.0 or fill.price > 1.0:
-            self._violations.append(
-                InvariantViolation(
-                    event_id=fill.fill_id,
-                    code="invalid_fill_price",
-                    message=f"fill price must be within [0,1], got {fill.price}",
-                )
-            )
+            self._record_violation(fill.fill_id, "invalid_fill_price", fill.price)
             return False
 
         if not isfinite(fill.size) or fill.size <= 0.0:
-            self._violations.append(
-                InvariantViolation(
-                    event_id=fill.fill_id,
-                    code="invalid_fill_size",
-                    message=f"fill size must be > 0, got {fill.size}",
-                )
-            )
+            self._record_violation(fill.fill_id, "invalid_fill_size", fill.size)
             return False
 
         return True
@@ -191,29 +289,11 @@ class AccountingEngine:
     ) -> None:
         drift = first_leg + second_leg
         if abs(drift) > self._tol:
-            self._violations.append(
-                InvariantViolation(
-                    event_id=event_id,
-                    code=f"{quantity_name}_transfer_not_zero_sum",
-                    message=f"{quantity_name} transfer drifted by {drift}",
-                )
-            )
+            self._record_violation(event_id, f"{quantity_name}_transfer_not_zero_sum", drift)
 
     def _check_conservation(
         self, event_id: str, before: float, after: float, quantity_name: str
     ) -> None:
         drift = after - before
         if abs(drift) > self._tol:
-            self._violations.append(
-                InvariantViolation(
-                    event_id=event_id,
-                    code=f"{quantity_name}_conservation_violation",
-                    message=f"total {quantity_name} drifted by {drift}",
-                )
-            )
-
-    def _total_cash(self) -> float:
-        return sum(account.cash for account in self._accounts.values())
-
-    def _total_inventory(self) -> float:
-        return sum(account.inventory for account in self._accounts.values())
+            self._record_violation(event_id, f"{quantity_name}_conservation_violation", drift)
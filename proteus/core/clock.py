@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import heapq
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, replace
+from collections.abc import Sequence
+from dataclasses import replace
 
 from proteus.core.events import Event
 
@@ -39,26 +40,20 @@ class EventClock(Clock):
         return self._now_ms
 
 
-@dataclass(order=True)
-class _ScheduledEvent:
-    """
-    Heap item ordering policy:
-    1. 'ts_ms'
-    2. 'priority' (lower value wins)
-    3. 'seq_no' (submission order tie_break)
-    """
-
-    ts_ms: int
-    priority: int
-    seq_no: int
-    event: Event = field(compare=False)
+# Bucket heaps hold packed int keys (priority << _SEQ_BITS) + seq_no, so sifts compare
+# plain ints: lower priority wins, then submission order. Events live in a side table
+# keyed by seq_no. Order is exact while seq_no < 2**_SEQ_BITS.
+_SEQ_BITS = 40
+_SEQ_MASK = (1 << _SEQ_BITS) - 1
 
 
 class EventScheduler:
     """
     Deterministic event scheduler with tie-break policy.
 
-    Timestamp precision is milliseconds
+    Timestamp precision is milliseconds. Events are bucketed per timestamp
+    (calendar queue): a min-heap over distinct active timestamps picks the
+    next bucket, and each bucket orders its own events by priority/seq.
     """
 
     def __init__(self, start_ms: int = 0) -> None:
@@ -67,7 +62,9 @@ class EventScheduler:
         self._clock = EventClock()
         if start_ms:
             self._clock.advance(start_ms)
-        self._queue: list[_ScheduledEvent] = []
+        self._buckets: dict[int, list[int]] = {}
+        self._bucket_ts: list[int] = []  # min-heap of timestamps with pending events
+        self._events_by_seq: dict[int, Event] = {}
         self._next_seq: int = 1
 
     @property
@@ -80,28 +77,80 @@ class EventScheduler:
         seq = self._next_seq
         self._next_seq += 1
         scheduled_event = replace(event, seq_no=seq)
-        heapq.heappush(
-            self._queue,
-            _ScheduledEvent(
-                ts_ms=scheduled_event.ts_ms,
-                priority=priority,
-                seq_no=seq,
-                event=scheduled_event,
-            ),
-        )
+        key = (priority << _SEQ_BITS) + seq
+        self._events_by_seq[seq] = scheduled_event
+
+        bucket = self._buckets.get(scheduled_event.ts_ms)
+        if bucket is None:
+            self._buckets[scheduled_event.ts_ms] = [key]
+            heapq.heappush(self._bucket_ts, scheduled_event.ts_ms)
+        else:
+            heapq.heappush(bucket, key)
         return scheduled_event
 
+    def schedule_many(
+        self, events: Sequence[Event], priorities: Sequence[int] | None = None
+    ) -> list[Event]:
+        """
+        Schedule a batch of events as if by consecutive schedule() calls.
+
+        The whole batch is validated before anything is queued. Buckets for
+        timestamps not yet pending are built in one pass and heapified,
+        rather than pushed into event by event.
+        """
+        if priorities is None:
+            priorities = [0] * len(events)
+        elif len(priorities) != len(events):
+            raise ValueError("priorities must match events in length")
+        if not events:
+            return []
+        if min(event.ts_ms for event in events) < self.now_ms:
+            raise ValueError("cannot schedule in the past")
+
+        first_seq = self._next_seq
+        self._next_seq += len(events)
+        scheduled_events = [
+            replace(event, seq_no=seq) for seq, event in enumerate(events, first_seq)
+        ]
+        buckets = self._buckets
+        fresh: dict[int, list[int]] = {}
+        for scheduled_event, priority in zip(scheduled_events, priorities):
+            seq = scheduled_event.seq_no
+            ts_ms = scheduled_event.ts_ms
+            key = (priority << _SEQ_BITS) + seq
+            self._events_by_seq[seq] = scheduled_event
+            bucket = buckets.get(ts_ms)
+            if bucket is not None:
+                heapq.heappush(bucket, key)
+            elif (bucket := fresh.get(ts_ms)) is not None:
+                bucket.append(key)
+            else:
+                fresh[ts_ms] = [key]
+
+        if fresh:
+            for ts_ms, bucket in fresh.items():
+                heapq.heapify(bucket)
+                buckets[ts_ms] = bucket
+            self._bucket_ts.extend(fresh)
+            heapq.heapify(self._bucket_ts)
+        return scheduled_events
+
     def has_pending(self) -> bool:
-        return bool(self._queue)
+        return bool(self._bucket_ts)
 
     def peek_next_ts(self) -> int | None:
-        if not self._queue:
+        if not self._bucket_ts:
             return None
-        return self._queue[0].ts_ms
+        return self._bucket_ts[0]
 
     def pop_next(self) -> Event | None:
-        if not self._queue:
+        if not self._bucket_ts:
             return None
-        next = heapq.heappop(self._queue)
-        self._clock.advance(next.ts_ms - self.now_ms)
-        return next.event
+        ts_ms = self._bucket_ts[0]
+        bucket = self._buckets[ts_ms]
+        event = self._events_by_seq.pop(heapq.heappop(bucket) & _SEQ_MASK)
+        if not bucket:
+            del self._buckets[ts_ms]
+            heapq.heappop(self._bucket_ts)
+        self._clock.advance(ts_ms - self.now_ms)
+        return event
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import Any, TypeVar
 
 
@@ -25,7 +26,7 @@ class Side(Enum):
     SELL = "sell"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     """
     Base event with required metadata.
@@ -49,7 +50,7 @@ class Event:
             raise ValueError("seq_no must be non-negative")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderIntent:
     """Agent order intent consumed by a mechanism."""
 
@@ -62,7 +63,7 @@ class OrderIntent:
     tif: str = "GTC"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CancelIntent:
     """Agent cancellation intent consumed by a mechanism."""
 
@@ -72,7 +73,7 @@ class CancelIntent:
     order_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Fill:
     """Execution fill emitted by a mechanism."""
 
@@ -91,6 +92,9 @@ def event_sort_key(event: Event) -> tuple[int, int, str]:
     return (event.ts_ms, event.seq_no, event.event_id)
 
 
+# C-level equivalent of event_sort_key; skips one Python frame per event when sorting.
+_REPLAY_SORT_KEY = attrgetter("ts_ms", "seq_no", "event_id")
+
 StateT = TypeVar("StateT")
 
 
@@ -101,9 +105,13 @@ def replay_events(
 ) -> StateT:
     """
     Rebuild state from an event log using deterministic ordering.
+
+    The reducer is called once per event, so this stays a generic Python fold.
+    Numeric replays of fills should go through AccountingEngine.process_fills,
+    which has a batch-specialized loop.
     """
 
     state = initial_state
-    for event in sorted(events, key=event_sort_key):
+    for event in sorted(events, key=_REPLAY_SORT_KEY):
         state = reducer(state, event)
     return state
@@ -5,6 +5,8 @@ from __future__ import annotations
 import hashlib
 import random
 from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
 
 
 def _hash_to_u64(text: str) -> int:
@@ -12,6 +14,7 @@ def _hash_to_u64(text: str) -> int:
     return int.from_bytes(digest[:8], "big", signed=False)
 
 
+@lru_cache(maxsize=4096)
 def derive_repetition_seed(base_seed: int, repetition: int) -> int:
     """
     derive a stable per-repetition seed from one scenario seed.
@@ -27,22 +30,37 @@ class RNGManager:
 
     base_seed: int
     _streams: dict[str, random.Random] = field(default_factory=dict, init=False, repr=False)
+    _seed_cache: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _prefix_hasher: Any = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Every child seed hashes "<base_seed>:<name>"; absorb the shared prefix once
+        # and clone the hasher state per name.
+        self._prefix_hasher = hashlib.sha256(b"%d:" % self.base_seed)
 
     def child_seed(self, name: str) -> int:
         """
         Deterministically map a stream name to a child seed.
         """
-        if not name:
-            raise ValueError("stream name must be non-empty")
-        return _hash_to_u64(f"{self.base_seed}:{name}")
+        seed = self._seed_cache.get(name)
+        if seed is None:
+            if not name:
+                raise ValueError("stream name must be non-empty")
+            hasher = self._prefix_hasher.copy()
+            hasher.update(name.encode("ascii"))
+            digest = hasher.digest()
+            seed = int.from_bytes(digest[:8], "big", signed=False)
+            self._seed_cache[name] = seed
+        return seed
 
     def stream(self, name: str) -> random.Random:
         """
         Returns a persistent RNG stream for the given subsystem name.
         """
-        if name not in self._streams:
-            self._streams[name] = random.Random(self.child_seed(name))
-        return self._streams[name]
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = random.Random(self.child_seed(name))
+        return stream
 
     def reset(self) -> None:
         """
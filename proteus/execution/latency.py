@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from random import Random
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LatencyProfile:
     """
     Latency parameters for one mechanism
@@ -46,26 +46,26 @@ class LatencyModel(ABC):
 
 
 class ConstantLatencyModel(LatencyModel):
-    """Fixed delay latency model."""
+    """Fixed delay latency model; the delays are readable as plain attributes."""
 
     def __init__(self, submission_ms: int = 1, ack_ms: int = 1, fill_ms: int = 1) -> None:
         if submission_ms < 0 or ack_ms < 0 or fill_ms < 0:
             raise ValueError("latencies must be non-negative")
-        self._submission_ms = submission_ms
-        self._ack_ms = ack_ms
-        self._fill_ms = fill_ms
+        self.submission_ms = submission_ms
+        self.ack_ms = ack_ms
+        self.fill_ms = fill_ms
 
     def submission_delay_ms(self, mechanism_name: str = "clob") -> int:
         _ = mechanism_name
-        return self._submission_ms
+        return self.submission_ms
 
     def ack_delay_ms(self, mechanism_name: str = "clob") -> int:
         _ = mechanism_name
-        return self._ack_ms
+        return self.ack_ms
 
     def fill_delay_ms(self, mechanism_name: str = "clob") -> int:
         _ = mechanism_name
-        return self._fill_ms
+        return self.fill_ms
 
 
 class ConfigurableLatencyModel(LatencyModel):
@@ -83,26 +83,31 @@ class ConfigurableLatencyModel(LatencyModel):
         self._default = default or LatencyProfile()
         self._per_mechanism = per_mechanism or {}
         self._rng = Random(seed)
+        # randrange(n) draws exactly what randint(0, n - 1) would, minus the wrapper.
+        self._randrange = self._rng.randrange
 
     def submission_delay_ms(self, mechanism_name: str = "clob") -> int:
-        profile = self._profile_for(mechanism_name)
+        profile = self._per_mechanism.get(mechanism_name, self._default)
+        if profile.jitter_ms == 0:
+            return profile.submission_ms
         return self._draw(profile.submission_ms, profile.jitter_ms)
 
     def ack_delay_ms(self, mechanism_name: str = "clob") -> int:
-        profile = self._profile_for(mechanism_name)
+        profile = self._per_mechanism.get(mechanism_name, self._default)
+        if profile.jitter_ms == 0:
+            return profile.ack_ms
         return self._draw(profile.ack_ms, profile.jitter_ms)
 
     def fill_delay_ms(self, mechanism_name: str = "clob") -> int:
-        profile = self._profile_for(mechanism_name)
+        profile = self._per_mechanism.get(mechanism_name, self._default)
+        if profile.jitter_ms == 0:
+            return profile.fill_ms
         return self._draw(profile.fill_ms, profile.jitter_ms)
 
-    def _profile_for(self, mechanism_name: str) -> LatencyProfile:
-        return self._per_mechanism.get(mechanism_name, self._default)
-
     def _draw(self, base_ms: int, jitters_ms: int) -> int:
         if jitters_ms == 0:
             return base_ms
-        return base_ms + self._rng.randint(0, jitters_ms)
+        return base_ms + self._randrange(jitters_ms + 1)
 
 
 SUPPORTED_MECHANISMS: tuple[str, ...] = ("clob", "fba", "rfq")
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from proteus.core.events import Event, EventType
 
+_ALL_EVENT_TYPES: frozenset[EventType] = frozenset(EventType)
+
 
 class LeakagePolicy(ABC):
     """Defines visibility of events to each agent."""
@@ -43,7 +46,7 @@ class PublicTapeLeakagePolicy(LeakagePolicy):
         return dict(event.payload)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MechanismLeakageSpec:
     """
     Per-mechanism leakage mapping.
@@ -68,6 +71,17 @@ class MechanismLeakagePolicy(LeakagePolicy):
         "requester_id",
         "dealer_id",
     )
+    # Participant keys each event type's payload actually carries, keyed by member
+    # name (see _ResolvedSpec); unlisted types fall back to every participant key.
+    _PARTICIPANT_KEYS_BY_TYPE: dict[str, tuple[str, ...]] = {
+        EventType.ORDER.name: ("agent_id",),
+        EventType.CANCEL.name: ("agent_id",),
+        EventType.QUOTE.name: ("agent_id",),
+        EventType.FILL.name: ("buy_agent_id", "sell_agent_id"),
+        EventType.RFQ_REQUEST.name: ("requester_id", "agent_id"),
+        EventType.RFQ_QUOTE.name: ("dealer_id", "requester_id"),
+        EventType.RFQ_ACCEPT.name: ("requester_id", "dealer_id"),
+    }
 
     def __init__(
         self,
@@ -76,18 +90,29 @@ class MechanismLeakagePolicy(LeakagePolicy):
         per_mechanism: dict[str, MechanismLeakageSpec] | None = None,
     ) -> None:
         self._default_spec = default_spec or MechanismLeakageSpec()
-        self._per_mechanism = per_mechanism or {}
+        self._per_mechanism = dict(per_mechanism or {})
+        # Resolve each mechanism's spec once so a query is one dict hit plus string-keyed
+        # lookups; all-public mechanisms skip per-event checks entirely.
+        self._default_resolved = _resolve_spec(self._default_spec)
+        self._resolved = {name: _resolve_spec(spec) for name, spec in self._per_mechanism.items()}
 
     def is_visible(self, event: Event, agent_id: str, mechanism_name: str = "clob") -> bool:
-        spec = self._spec_for(mechanism_name)
-        if event.event_type in spec.public_event_types:
+        all_public, public_types, selective = self._resolved.get(
+            mechanism_name, self._default_resolved
+        )
+        if all_public:
+            return True
+        type_name = event.event_type._name_
+        if type_name in public_types:
             return True
 
-        allowed_fields = spec.selective_payload_fields.get(event.event_type)
+        allowed_fields = selective.get(type_name)
         if allowed_fields is None:
             return False
 
-        return self._is_participant(event, agent_id) or len(allowed_fields) > 0
+        # A non-empty field allowance makes the event visible to everyone, so the
+        # participant lookup is only needed for empty allowances.
+        return len(allowed_fields) > 0 or self._is_participant(event, agent_id)
 
     def visible_payload(
         self,
@@ -95,38 +120,56 @@ class MechanismLeakagePolicy(LeakagePolicy):
         agent_id: str,
         mechanism_name: str = "clob",
     ) -> dict[str, object]:
-        if not self.is_visible(event, agent_id, mechanism_name):
+        payload = event.payload
+        all_public, public_types, selective = self._resolved.get(
+            mechanism_name, self._default_resolved
+        )
+        if all_public:
+            return dict(payload)
+        type_name = event.event_type._name_
+        if type_name in public_types:
+            return dict(payload)
+
+        allowed_fields = selective.get(type_name)
+        if not allowed_fields:
+            # Hidden, or visible to participants with no exposed fields.
             return {}
-
-        spec = self._spec_for(mechanism_name)
-        if event.event_type in spec.public_event_types:
-            return dict(event.payload)
-
-        allowed_fields = spec.selective_payload_fields.get(event.event_type, frozenset())
-        visible: dict[str, object] = {}
-        for key in allowed_fields:
-            if key in event.payload:
-                visible[key] = event.payload[key]
-        return visible
-
-    def _spec_for(self, mechanism_name: str) -> MechanismLeakageSpec:
-        return self._per_mechanism.get(mechanism_name, self._default_spec)
+        return {key: payload[key] for key in allowed_fields if key in payload}
 
     def _is_participant(self, event: Event, agent_id: str) -> bool:
-        for key in self._PARTICIPANT_KEYS:
-            if event.payload.get(key) == agent_id:
+        payload = event.payload
+        keys = self._PARTICIPANT_KEYS_BY_TYPE.get(event.event_type._name_, self._PARTICIPANT_KEYS)
+        for key in keys:
+            if payload.get(key) == agent_id:
                 return True
         return False
 
 
+# (all types public, public type names, selective fields by type name). Event types
+# are looked up by member name because Enum.__hash__ is a Python-level call while str
+# hashes are cached, which makes membership tests several times cheaper.
+_ResolvedSpec = tuple[bool, frozenset[str], dict[str, frozenset[str]]]
+
+
+def _resolve_spec(spec: MechanismLeakageSpec) -> _ResolvedSpec:
+    return (
+        spec.public_event_types >= _ALL_EVENT_TYPES,
+        frozenset(event_type.name for event_type in spec.public_event_types),
+        {event_type.name: fields for event_type, fields in spec.selective_payload_fields.items()},
+    )
+
+
 SUPPORTED_MECHANISMS: tuple[str, ...] = ("clob", "fba", "rfq")
 
 
+@lru_cache(maxsize=1)
 def build_default_leakage_policy() -> MechanismLeakagePolicy:
     """
     Default parity policy: all mechanisms share fully public tape assumptions.
+
+    The policy is stateless, so one shared instance is returned.
     """
-    public_spec = MechanismLeakageSpec(public_event_types=frozenset(set(EventType)))
+    public_spec = MechanismLeakageSpec(public_event_types=_ALL_EVENT_TYPES)
     per_mechanism = {name: public_spec for name in SUPPORTED_MECHANISMS}
     return MechanismLeakagePolicy(default_spec=public_spec, per_mechanism=per_mechanism)
 
@@ -137,7 +180,7 @@ def build_rfq_private_leakage_policy() -> MechanismLeakagePolicy:
     RFQ request/quote/accept expose only selected fields.
     """
 
-    public_spec = MechanismLeakageSpec(public_event_types=frozenset(set(EventType)))
+    public_spec = MechanismLeakageSpec(public_event_types=_ALL_EVENT_TYPES)
 
     rfq_spec = MechanismLeakageSpec(
         public_event_types=frozenset(
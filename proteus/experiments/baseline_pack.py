@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import csv
 import json
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
+from functools import partial
 from math import sqrt
 from pathlib import Path
 from statistics import mean, stdev
@@ -18,8 +20,11 @@ from proteus.experiments.calibration import (
     simulate_clob_regime,
 )
 
+# (n, mean, sample stdev); stdev is 0.0 below two values.
+_SampleStats = tuple[int, float, float]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BaselinePackConfig:
     base_seed: int = 7
     repetitions: int = 20
@@ -30,9 +35,10 @@ class BaselinePackConfig:
     baseline_informed_activity_prob: float = 0.06
     baseline_submission_latency_ms: int = 1
     calibration: CalibrationSearchConfig = field(default_factory=CalibrationSearchConfig)
+    workers: int = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaselinePackResult:
     report_path: str
     summary_csv_path: str
@@ -62,6 +68,7 @@ def run_clob_baseline_pack(
         informed_activity_grid=config.calibration.informed_activity_grid,
         latency_submission_grid_ms=config.calibration.latency_submission_grid_ms,
         criteria=config.calibration.criteria,
+        workers=config.workers,
     )
 
     calibration = run_clob_calibration(
@@ -71,36 +78,37 @@ def run_clob_baseline_pack(
     )
     regime = calibration.selected_regime
 
-    baseline_runs = _run_cell(
+    # Cell 0 is the baseline; the rest follow the grid in row order.
+    cells = [(config.baseline_informed_activity_prob, config.baseline_submission_latency_ms)]
+    cells.extend(
+        (informed_prob, submission_latency_ms)
+        for informed_prob in config.informed_activity_grid
+        for submission_latency_ms in config.latency_submission_grid_ms
+    )
+    baseline_runs, *grid_runs = _run_cells(
+        cells=cells,
         seeds=seeds,
         duration_ms=config.duration_ms,
         step_ms=config.step_ms,
         regime=regime,
-        informed_activity_prob=config.baseline_informed_activity_prob,
-        submission_latency_ms=config.baseline_submission_latency_ms,
+        workers=config.workers,
     )
 
-    rows: list[dict[str, float]] = []
-    for informed_prob in config.informed_activity_grid:
-        for submission_latency_ms in config.latency_submission_grid_ms:
-            runs = _run_cell(
-                seeds=seeds,
-                duration_ms=config.duration_ms,
-                step_ms=config.step_ms,
-                regime=regime,
-                informed_activity_prob=informed_prob,
-                submission_latency_ms=submission_latency_ms,
-            )
-            rows.append(
-                _summarize_cell(
-                    runs=runs,
-                    baseline_runs=baseline_runs,
-                    informed_activity_prob=informed_prob,
-                    submission_latency_ms=submission_latency_ms,
-                )
-            )
+    baseline_mm_pnl = _sample_stats([row.mm_pnl for row in baseline_runs])
+    rows = [
+        _summarize_cell(
+            runs=runs,
+            baseline_mm_pnl=baseline_mm_pnl,
+            informed_activity_prob=informed_prob,
+            submission_latency_ms=submission_latency_ms,
+        )
+        for (informed_prob, submission_latency_ms), runs in zip(cells[1:], grid_runs, strict=True)
+    ]
 
     config_payload = asdict(config)
+    # Worker count never changes results, so keep it out of the report.
+    del config_payload["workers"]
+    del config_payload["calibration"]["workers"]
     config_payload["effective_repetition_seeds"] = list(seeds)
     config_payload["calibration"]["seeds"] = list(seeds)
     config_payload["calibration"]["duration_ms"] = config.duration_ms
@@ -137,44 +145,65 @@ def _validate_config(config: BaselinePackConfig) -> None:
         raise ValueError("informed_activity_grid must be non-empty")
     if not config.latency_submission_grid_ms:
         raise ValueError("latency_submission_grid_ms must be non-empty")
+    if config.workers <= 0:
+        raise ValueError("workers must be > 0")
 
 
-def _run_cell(
+def _run_cells(
     *,
+    cells: list[tuple[float, int]],
     seeds: tuple[int, ...],
     duration_ms: int,
     step_ms: int,
     regime: CandidateRegime,
-    informed_activity_prob: float,
-    submission_latency_ms: int,
-) -> list[RunMetrics]:
-    return [
-        simulate_clob_regime(
-            seed=seed,
-            duration_ms=duration_ms,
-            step_ms=step_ms,
-            regime=regime,
-            informed_activity_prob=informed_activity_prob,
-            submission_latency_ms=submission_latency_ms,
-        )
-        for seed in seeds
-    ]
+    workers: int,
+) -> list[list[RunMetrics]]:
+    """
+    Run every (informed_activity_prob, submission_latency_ms) cell over all seeds.
+
+    Each run is seeded independently, and results are regrouped in submission order,
+    so the output is identical for any worker count.
+    """
+    jobs = [(seed, informed, latency) for informed, latency in cells for seed in seeds]
+    simulate = partial(_simulate_job, duration_ms=duration_ms, step_ms=step_ms, regime=regime)
+    if workers == 1:
+        results = [simulate(job) for job in jobs]
+    else:
+        chunksize = max(1, len(jobs) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(simulate, jobs, chunksize=chunksize))
+
+    n_seeds = len(seeds)
+    return [results[i : i + n_seeds] for i in range(0, len(results), n_seeds)]
+
+
+def _simulate_job(
+    job: tuple[int, float, int],
+    *,
+    duration_ms: int,
+    step_ms: int,
+    regime: CandidateRegime,
+) -> RunMetrics:
+    seed, informed_activity_prob, submission_latency_ms = job
+    return simulate_clob_regime(
+        seed=seed,
+        duration_ms=duration_ms,
+        step_ms=step_ms,
+        regime=regime,
+        informed_activity_prob=informed_activity_prob,
+        submission_latency_ms=submission_latency_ms,
+    )
 
 
 def _summarize_cell(
     *,
     runs: list[RunMetrics],
-    baseline_runs: list[RunMetrics],
+    baseline_mm_pnl: _SampleStats,
     informed_activity_prob: float,
     submission_latency_ms: int,
 ) -> dict[str, float]:
-    mm_pnl = [row.mm_pnl for row in runs]
-    mm_drawdown = [row.mm_max_drawdown for row in runs]
-    mm_as_loss = [row.mm_adverse_selection_loss for row in runs]
-    spreads = [row.market_spread_mean for row in runs]
-    stable = [1.0 if row.stable else 0.0 for row in runs]
-
-    baseline_mm_pnl = [row.mm_pnl for row in baseline_runs]
+    mm_pnl = _sample_stats([row.mm_pnl for row in runs])
+    spreads = _sample_stats([row.market_spread_mean for row in runs])
 
     mm_pnl_mean, mm_pnl_ci95_low, mm_pnl_ci95_high = _mean_ci95(mm_pnl)
     spread_mean, spread_ci95_low, spread_ci95_high = _mean_ci95(spreads)
@@ -186,40 +215,45 @@ def _summarize_cell(
         "mm_pnl_mean": mm_pnl_mean,
         "mm_pnl_ci95_low": mm_pnl_ci95_low,
         "mm_pnl_ci95_high": mm_pnl_ci95_high,
-        "mm_drawdown_mean": mean(mm_drawdown),
-        "mm_as_loss_mean": mean(mm_as_loss),
+        "mm_drawdown_mean": mean([row.mm_max_drawdown for row in runs]),
+        "mm_as_loss_mean": mean([row.mm_adverse_selection_loss for row in runs]),
         "market_spread_mean": spread_mean,
         "market_spread_ci95_low": spread_ci95_low,
         "market_spread_ci95_high": spread_ci95_high,
-        "stable_rate": mean(stable),
+        "stable_rate": mean([1.0 if row.stable else 0.0 for row in runs]),
         "effect_size_mm_pnl_vs_baseline_d": _cohens_d(mm_pnl, baseline_mm_pnl),
     }
 
 
-def _mean_ci95(values: list[float]) -> tuple[float, float, float]:
-    mu = mean(values)
-    if len(values) < 2:
+def _sample_stats(values: list[float]) -> _SampleStats:
+    n = len(values)
+    return (n, mean(values), stdev(values) if n >= 2 else 0.0)
+
+
+def _mean_ci95(stats: _SampleStats) -> tuple[float, float, float]:
+    n, mu, sd = stats
+    if n < 2:
         return (mu, mu, mu)
-    half_width = 1.96 * (stdev(values) / sqrt(len(values)))
+    half_width = 1.96 * (sd / sqrt(n))
     return (mu, mu - half_width, mu + half_width)
 
 
-def _cohens_d(sample: list[float], baseline: list[float]) -> float:
-    if len(sample) < 2 or len(baseline) < 2:
+def _cohens_d(sample: _SampleStats, baseline: _SampleStats) -> float:
+    sample_n, sample_mean, sample_sd = sample
+    baseline_n, baseline_mean, baseline_sd = baseline
+    if sample_n < 2 or baseline_n < 2:
         return 0.0
 
-    sample_sd = stdev(sample)
-    baseline_sd = stdev(baseline)
-    degrees_of_freedom = len(sample) + len(baseline) - 2
+    degrees_of_freedom = sample_n + baseline_n - 2
     if degrees_of_freedom <= 0:
         return 0.0
 
     pooled_variance = (
-        ((len(sample) - 1) * (sample_sd**2)) + ((len(baseline) - 1) * (baseline_sd**2))
+        ((sample_n - 1) * (sample_sd**2)) + ((baseline_n - 1) * (baseline_sd**2))
     ) / degrees_of_freedom
     if pooled_variance <= 0.0:
         return 0.0
-    return (mean(sample) - mean(baseline)) / sqrt(pooled_variance)
+    return (sample_mean - baseline_mean) / sqrt(pooled_variance)
 
 
 def _write_summary_csv(path: Path, rows: list[dict[str, float]]) -> None:
@@ -227,6 +261,6 @@ def _write_summary_csv(path: Path, rows: list[dict[str, float]]) -> None:
         return
     fieldnames = list(rows[0].keys())
     with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows([row[name] for name in fieldnames] for row in rows)
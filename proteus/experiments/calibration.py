@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
-from collections import defaultdict
-from collections.abc import Iterable, Iterator
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache, partial
+from heapq import heappop, heappush
 from pathlib import Path
 from random import Random
 from statistics import mean
@@ -50,6 +53,9 @@ class CalibrationSearchConfig:
 
     criteria: SurvivalCriteria = field(default_factory=SurvivalCriteria)
 
+    # Processes used for the candidate and sensitivity runs; results do not depend on it.
+    workers: int = 1
+
 
 @dataclass(frozen=True)
 class CandidateRegime:
@@ -92,39 +98,84 @@ def run_clob_calibration(
         for min_half_spread in config.mm_min_half_spread_grid
     ]
 
-    scored: list[tuple[float, CandidateRegime, list[RunMetrics]]] = []
-    stable_count = 0
-
-    for regime in _with_progress(
-        candidates,
-        label="PT-010 calibration candidates",
-        enabled=show_progress,
-    ):
-        runs = [
-            _simulate_one(
-                seed=seed,
-                duration_ms=config.duration_ms,
-                step_ms=config.step_ms,
-                regime=regime,
-                informed_activity_prob=config.baseline_informed_activity_prob,
-                submission_latency_ms=config.baseline_submission_latency_ms,
-                criteria=config.criteria,
+    if config.workers <= 0:
+        raise ValueError("workers must be > 0")
+
+    simulate = partial(
+        _simulate_job,
+        duration_ms=config.duration_ms,
+        step_ms=config.step_ms,
+        criteria=config.criteria,
+    )
+    n_seeds = len(config.seeds)
+
+    with _run_map(config.workers) as run_map:
+        # Every run is submitted up front and consumed in submission order, so the
+        # selection and the rows below are identical for any worker count.
+        candidate_results = run_map(
+            simulate,
+            [
+                (
+                    seed,
+                    regime,
+                    config.baseline_informed_activity_prob,
+                    config.baseline_submission_latency_ms,
+                )
+                for regime in candidates
+                for seed in config.seeds
+            ],
+        )
+
+        scored: list[tuple[float, CandidateRegime, list[RunMetrics]]] = []
+        stable_count = 0
+
+        for regime in _with_progress(
+            candidates,
+            label="PT-010 calibration candidates",
+            enabled=show_progress,
+        ):
+            runs = [next(candidate_results) for _ in range(n_seeds)]
+            if all(row.stable for row in runs):
+                stable_count += 1
+
+            # Risk-adjusted baseline score used to select one candidate.
+            score = (
+                mean(row.mm_pnl for row in runs)
+                - mean(row.mm_max_drawdown for row in runs)
+                - (0.5 * mean(abs(row.mm_adverse_selection_loss) for row in runs))
             )
-            for seed in config.seeds
+            scored.append((score, regime, runs))
+
+        stable_scored = [item for item in scored if all(row.stable for row in item[2])]
+        _, selected_regime, selected_runs = max(stable_scored or scored, key=lambda x: x[0])
+
+        cells = [
+            (informed_prob, submission_latency_ms)
+            for informed_prob in config.informed_activity_grid
+            for submission_latency_ms in config.latency_submission_grid_ms
         ]
-        if all(row.stable for row in runs):
-            stable_count += 1
-
-        # Risk-adjusted baseline score used to select one candidate.
-        score = (
-            mean(row.mm_pnl for row in runs)
-            - mean(row.mm_max_drawdown for row in runs)
-            - (0.5 * mean(abs(row.mm_adverse_selection_loss) for row in runs))
+        sensitivity_results = run_map(
+            simulate,
+            [
+                (seed, selected_regime, informed_prob, submission_latency_ms)
+                for informed_prob, submission_latency_ms in cells
+                for seed in config.seeds
+            ],
         )
-        scored.append((score, regime, runs))
 
-    stable_scored = [item for item in scored if all(row.stable for row in item[2])]
-    _, selected_regime, selected_runs = max(stable_scored or scored, key=lambda x: x[0])
+        sensitivity_rows: list[dict[str, float]] = []
+        for informed_prob, submission_latency_ms in cells:
+            runs = [next(sensitivity_results) for _ in range(n_seeds)]
+            sensitivity_rows.append(
+                {
+                    "informed_activity_prob": informed_prob,
+                    "submission_latency_ms": float(submission_latency_ms),
+                    "mm_pnl_mean": mean(row.mm_pnl for row in runs),
+                    "mm_drawdown_mean": mean(row.mm_max_drawdown for row in runs),
+                    "mm_as_loss_mean": mean(row.mm_adverse_selection_loss for row in runs),
+                    "stable_rate": mean(1.0 if row.stable else 0.0 for row in runs),
+                }
+            )
 
     baseline_summary = {
         "mm_pnl_mean": mean(row.mm_pnl for row in selected_runs),
@@ -138,32 +189,6 @@ def run_clob_calibration(
         "(pnl - drawdown - 0.5*|adverse_selection_loss|) under low informed activity."
     )
 
-    sensitivity_rows: list[dict[str, float]] = []
-    for informed_prob in config.informed_activity_grid:
-        for submission_latency_ms in config.latency_submission_grid_ms:
-            runs = [
-                _simulate_one(
-                    seed=seed,
-                    duration_ms=config.duration_ms,
-                    step_ms=config.step_ms,
-                    regime=selected_regime,
-                    informed_activity_prob=informed_prob,
-                    submission_latency_ms=submission_latency_ms,
-                    criteria=config.criteria,
-                )
-                for seed in config.seeds
-            ]
-            sensitivity_rows.append(
-                {
-                    "informed_activity_prob": informed_prob,
-                    "submission_latency_ms": float(submission_latency_ms),
-                    "mm_pnl_mean": mean(row.mm_pnl for row in runs),
-                    "mm_drawdown_mean": mean(row.mm_max_drawdown for row in runs),
-                    "mm_as_loss_mean": mean(row.mm_adverse_selection_loss for row in runs),
-                    "stable_rate": mean(1.0 if row.stable else 0.0 for row in runs),
-                }
-            )
-
     report = CalibrationReport(
         selected_regime=selected_regime,
         baseline_summary=baseline_summary,
@@ -178,18 +203,41 @@ def run_clob_calibration(
     output_dir = Path(out_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     report_path = output_dir / report_name
-    report_payload = asdict(report)
-    report_payload["selected_regime"] = asdict(report.selected_regime)
-    report_payload["report_path"] = str(report_path)
-    report_path.write_text(json.dumps(report_payload, indent=2, sort_keys=True), encoding="utf-8")
-
-    return CalibrationReport(
-        selected_regime=report.selected_regime,
-        baseline_summary=report.baseline_summary,
-        baseline_rationale=report.baseline_rationale,
-        sensitivity_rows=report.sensitivity_rows,
-        stable_candidates_found=report.stable_candidates_found,
-        report_path=str(report_path),
+    report = replace(report, report_path=str(report_path))
+    report_path.write_text(json.dumps(asdict(report), indent=2, sort_keys=True), encoding="utf-8")
+    return report
+
+
+@contextmanager
+def _run_map(
+    workers: int,
+) -> Iterator[Callable[[Callable[..., RunMetrics], Iterable[object]], Iterator[RunMetrics]]]:
+    """
+    Yield an ordered, lazy map: the builtin when serial, a process pool otherwise.
+    """
+    if workers == 1:
+        yield map
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield executor.map
+
+
+def _simulate_job(
+    job: tuple[int, CandidateRegime, float, int],
+    *,
+    duration_ms: int,
+    step_ms: int,
+    criteria: SurvivalCriteria,
+) -> RunMetrics:
+    seed, regime, informed_activity_prob, submission_latency_ms = job
+    return _simulate_one(
+        seed=seed,
+        duration_ms=duration_ms,
+        step_ms=step_ms,
+        regime=regime,
+        informed_activity_prob=informed_activity_prob,
+        submission_latency_ms=submission_latency_ms,
+        criteria=criteria,
     )
 
 
@@ -220,6 +268,9 @@ def _with_progress(
         yield item
 
 
+# Runs are pure functions of their arguments and RunMetrics is frozen, so repeats are
+# shared: the baseline pack re-runs the calibration's baseline and sensitivity cells.
+@lru_cache(maxsize=1024, typed=True)
 def _simulate_one(
     *,
     seed: int,
@@ -245,8 +296,11 @@ def _simulate_one(
         seed=rng.child_seed("latency"),
     )
 
-    latent = BoundedLogOddsLatentProcess(p0=0.5, phi=0.995, sigma_eta=0.2)
-    latent.reset(rng.child_seed("latent"))
+    # One latent step per decision tick; the latent stream is isolated, so drawing
+    # the whole path up front leaves every other stream untouched.
+    truth_path = iter(
+        _latent_truth_path(rng.child_seed("latent"), step_ms, duration_ms // step_ms + 1)
+    )
 
     signal_model = HeterogeneousSignalModel(
         default=AgentSignalConfig(delay_ms=0, noise_stddev=0.01),
@@ -272,9 +326,18 @@ def _simulate_one(
     agents = [mm, inf, noise]
     decision_rng = Random(rng.child_seed("decision"))
     recorder = Recorder()
+    observe = signal_model.observe
+    # Private news ids are "news-private-<agent>-<seq>"; build each prefix once.
+    private_news = [(agent, f"news-private-{agent.agent_id}-") for agent in agents]
 
-    pending_orders: dict[int, list[OrderIntent]] = defaultdict(list)
-    pending_fills: dict[int, list[Fill]] = defaultdict(list)
+    # The profile has no jitter, so every delay is a constant for the run.
+    submit_delay = latency.submission_delay_ms("clob") + latency.ack_delay_ms("clob")
+    fill_delay = latency.fill_delay_ms("clob")
+
+    # Min-heaps of (due_ts, push_seq, item); push_seq keeps same-ts items in push order.
+    pending_orders: list[tuple[int, int, OrderIntent]] = []
+    pending_fills: list[tuple[int, int, Fill]] = []
+    push_seq = 0
 
     best_bid = 0.49
     best_ask = 0.51
@@ -289,15 +352,16 @@ def _simulate_one(
         if next_decision_ts <= duration_ms:
             candidate_ts.append(next_decision_ts)
         if pending_orders:
-            candidate_ts.append(min(pending_orders))
+            candidate_ts.append(pending_orders[0][0])
         if pending_fills:
-            candidate_ts.append(min(pending_fills))
+            candidate_ts.append(pending_fills[0][0])
         if not candidate_ts:
             break
 
         ts = min(candidate_ts)
 
-        for fill in pending_fills.pop(ts, []):
+        while pending_fills and pending_fills[0][0] == ts:
+            fill = heappop(pending_fills)[2]
             recorder.record_fill(fill)
             event_seq += 1
             fill_event = Event(
@@ -316,7 +380,8 @@ def _simulate_one(
             for agent in agents:
                 agent.on_event(fill_event)
 
-        for intent in pending_orders.pop(ts, []):
+        while pending_orders and pending_orders[0][0] == ts:
+            intent = heappop(pending_orders)[2]
             mechanism.submit(intent)
             event_seq += 1
             recorder.record(
@@ -334,11 +399,11 @@ def _simulate_one(
             )
 
         for fill in mechanism.clear(ts):
-            fill_due = ts + latency.fill_delay_ms("clob")
-            pending_fills[fill_due].append(fill)
+            push_seq += 1
+            heappush(pending_fills, (ts + fill_delay, push_seq, fill))
 
         if ts == next_decision_ts and ts <= duration_ms:
-            last_truth = latent.step(step_ms)
+            last_truth = next(truth_path)
             event_seq += 1
             recorder.record(
                 Event(
@@ -349,11 +414,11 @@ def _simulate_one(
                 )
             )
 
-            for agent in agents:
-                observed_signal = signal_model.observe(agent.agent_id, ts, last_truth)
+            for agent, private_news_prefix in private_news:
+                observed_signal = observe(agent.agent_id, ts, last_truth)
                 agent.on_event(
                     Event(
-                        event_id=f"news-private-{agent.agent_id}-{event_seq}",
+                        event_id=private_news_prefix + str(event_seq),
                         ts_ms=ts,
                         event_type=EventType.NEWS,
                         payload={"signal": observed_signal, "p_t": observed_signal},
@@ -378,25 +443,30 @@ def _simulate_one(
             for agent in agents:
                 agent.on_event(quote_event)
 
-            mm_intents = list(mm.generate_intents(ts))
-            bid_quotes = [intent for intent in mm_intents if intent.side is Side.BUY]
-            ask_quotes = [intent for intent in mm_intents if intent.side is Side.SELL]
-            if bid_quotes:
-                best_bid = max(intent.price for intent in bid_quotes)
-            if ask_quotes:
-                best_ask = min(intent.price for intent in ask_quotes)
-            if mm_intents:
-                quote_size = mm_intents[0].size
-
-            intents = list(mm_intents)
+            intents = list(mm.generate_intents(ts))
+            if intents:
+                quote_size = intents[0].size
+                bid: float | None = None
+                ask: float | None = None
+                for intent in intents:
+                    if intent.side is Side.BUY:
+                        if bid is None or intent.price > bid:
+                            bid = intent.price
+                    elif ask is None or intent.price < ask:
+                        ask = intent.price
+                if bid is not None:
+                    best_bid = bid
+                if ask is not None:
+                    best_ask = ask
+
             if decision_rng.random() < informed_activity_prob:
                 intents.extend(inf.generate_intents(ts))
             intents.extend(noise.generate_intents(ts))
 
-            submit_delay = latency.submission_delay_ms("clob") + latency.ack_delay_ms("clob")
+            due_ts = ts + submit_delay
             for intent in intents:
-                due_ts = ts + submit_delay
-                pending_orders[due_ts].append(intent)
+                push_seq += 1
+                heappush(pending_orders, (due_ts, push_seq, intent))
 
             next_decision_ts += step_ms
 
@@ -457,6 +527,19 @@ def simulate_clob_regime(
     )
 
 
+@lru_cache(maxsize=256)
+def _latent_truth_path(latent_seed: int, step_ms: int, n_steps: int) -> tuple[float, ...]:
+    """
+    Latent p_t per decision tick for one seed.
+
+    The path depends only on the seed and the step grid, not on the regime or the
+    sensitivity cell, so grid cells sharing a seed reuse it.
+    """
+    latent = BoundedLogOddsLatentProcess(p0=0.5, phi=0.995, sigma_eta=0.2)
+    latent.reset(latent_seed)
+    return tuple(latent.path(step_ms, n_steps))
+
+
 def _align_to_step(ts_ms: int, step_ms: int) -> int:
     if step_ms <= 0:
         raise ValueError("step_ms must be > 0")
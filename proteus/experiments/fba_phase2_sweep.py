@@ -92,6 +92,7 @@ def run_fba_phase2_sweep(
         informed_activity_grid=config.calibration.informed_activity_grid,
         latency_submission_grid_ms=config.calibration.latency_submission_grid_ms,
         criteria=config.calibration.criteria,
+        workers=config.calibration.workers,
     )
     calibration = run_clob_calibration(
         cal_cfg,
@@ -133,6 +134,8 @@ def run_fba_phase2_sweep(
 
     config_payload = asdict(config)
     config_payload["effective_repetition_seeds"] = list(seeds)
+    # Worker count never changes results, so keep it out of the report.
+    del config_payload["calibration"]["workers"]
     config_payload["calibration"]["seeds"] = list(seeds)
     config_payload["calibration"]["duration_ms"] = config.duration_ms
     config_payload["calibration"]["step_ms"] = config.step_ms
@@ -281,6 +284,8 @@ def _simulate_one_mechanism(
 
     decision_rng = Random(rng.child_seed("decision"))
     recorder = Recorder()
+    latent_step = latent.step
+    observe = signal_model.observe
 
     pending_orders: dict[int, list[OrderIntent]] = defaultdict(list)
     pending_fills: dict[int, list[Fill]] = defaultdict(list)
@@ -345,7 +350,7 @@ def _simulate_one_mechanism(
             pending_fills[ts + latency.fill_delay_ms(mech_name)].append(fill)
 
         if ts == next_decision_ts and ts <= duration_ms:
-            last_truth = latent.step(step_ms)
+            last_truth = latent_step(step_ms)
             event_seq += 1
             recorder.record(
                 Event(
@@ -357,7 +362,7 @@ def _simulate_one_mechanism(
             )
 
             for agent in agents:
-                observed_signal = signal_model.observe(agent.agent_id, ts, last_truth)
+                observed_signal = observe(agent.agent_id, ts, last_truth)
                 agent.on_event(
                     Event(
                         event_id=f"news-private-{agent.agent_id}-{event_seq}",
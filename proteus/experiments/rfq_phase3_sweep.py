@@ -94,6 +94,7 @@ def run_rfq_phase3_sweep(
         informed_activity_grid=config.calibration.informed_activity_grid,
         latency_submission_grid_ms=config.calibration.latency_submission_grid_ms,
         criteria=config.calibration.criteria,
+        workers=config.calibration.workers,
     )
     if show_progress:
         print("[proteus] phase3: running CLOB calibration")
@@ -170,6 +171,8 @@ def run_rfq_phase3_sweep(
 
     config_payload = asdict(config)
     config_payload["effective_repetition_seeds"] = list(seeds)
+    # Worker count never changes results, so keep it out of the report.
+    del config_payload["calibration"]["workers"]
     config_payload["calibration"]["seeds"] = list(seeds)
     config_payload["calibration"]["duration_ms"] = config.duration_ms
     config_payload["calibration"]["step_ms"] = config.step_ms
@@ -373,6 +376,7 @@ def _simulate_rfq_one(
 
     latent = BoundedLogOddsLatentProcess(p0=0.5, phi=0.995, sigma_eta=0.2)
     latent.reset(rng.child_seed("latent"))
+    latent_step = latent.step
 
     recorder = Recorder()
     pending_clears: set[int] = set()
@@ -425,7 +429,7 @@ def _simulate_rfq_one(
             pending_fills[fill_due_ts].append(fill)
 
         if ts == next_decision_ts and ts <= duration_ms:
-            last_truth = latent.step(step_ms)
+            last_truth = latent_step(step_ms)
             event_seq += 1
             recorder.record(
                 Event(
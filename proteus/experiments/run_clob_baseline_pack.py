@@ -14,6 +14,7 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--repetitions", type=int, default=20)
     parser.add_argument("--duration-ms", type=int, default=20_000)
     parser.add_argument("--step-ms", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=1)
     args = parser.parse_args(argv)
 
     config = BaselinePackConfig(
@@ -21,6 +22,7 @@ def main(argv: list[str] | None = None) -> int:
         repetitions=args.repetitions,
         duration_ms=args.duration_ms,
         step_ms=args.step_ms,
+        workers=args.workers,
     )
     result = run_clob_baseline_pack(config, out_dir=args.out_dir)
 
@@ -88,6 +88,13 @@ class BoundedLogOddsLatentProcess(LatentProcess):
 
         self._x = self._logit(p0)
         self._rng = Random(0)
+        # lam_dt is fixed for a given step size, so its Knuth threshold is reused.
+        self._poisson_lam = 0.0
+        self._poisson_threshold = 1.0
+        # Per-step constants depend only on delta_ms, which is fixed within a run.
+        self._step_delta_ms = -1
+        self._diffusion_scale = 0.0
+        self._lam_dt = 0.0
 
     def reset(self, seed: int) -> None:
         self._x = self._logit(self._p0)
@@ -99,23 +106,64 @@ class BoundedLogOddsLatentProcess(LatentProcess):
         if delta_ms == 0:
             return self._sigmoid(self._x)
 
-        dt_sec = delta_ms / 1000.0
-        eta = self._draw_diffusion_shock(dt_sec)
-        jumps = self._draw_jump_shock(dt_sec)
+        if delta_ms != self._step_delta_ms:
+            dt_sec = delta_ms / 1000.0
+            self._step_delta_ms = delta_ms
+            self._diffusion_scale = self._sigma_eta * sqrt(dt_sec)
+            self._lam_dt = self._jump.intensity_per_second * dt_sec
+        eta = self._draw_diffusion_shock(self._diffusion_scale)
+        jumps = self._draw_jump_shock(self._lam_dt)
         self._x = (self._phi * self._x) + eta + jumps
         return self._sigmoid(self._x)
 
-    def _draw_diffusion_shock(self, dt_sec: float) -> float:
+    def path(self, delta_ms: int, n_steps: int) -> list[float]:
+        """
+        Advance n_steps of delta_ms each and return every p_t.
+
+        Matches n_steps successive step(delta_ms) calls draw for draw, with the
+        per-step constants computed once.
+        """
+        if delta_ms < 0:
+            raise ValueError("delta_ms must  be non-negative")
+        if n_steps < 0:
+            raise ValueError("n_steps must be non-negative")
+        if delta_ms == 0:
+            return [self._sigmoid(self._x)] * n_steps
+
+        dt_sec = delta_ms / 1000.0
+        diffuse = self._sigma_eta != 0.0
+        diffusion_scale = self._sigma_eta * sqrt(dt_sec)
+        jump = self._jump
+        jumps_enabled = jump.enabled
+        lam_dt = jump.intensity_per_second * dt_sec
+        gauss = self._rng.gauss
+        poisson = self._poisson
+        sigmoid = self._sigmoid
+        phi = self._phi
+
+        x = self._x
+        out: list[float] = []
+        for _ in range(n_steps):
+            eta = gauss(0.0, diffusion_scale) if diffuse else 0.0
+            jumps = 0.0
+            if jumps_enabled:
+                for _ in range(poisson(lam_dt)):
+                    jumps += gauss(jump.mean, jump.stddev)
+            x = (phi * x) + eta + jumps
+            out.append(sigmoid(x))
+        self._x = x
+        return out
+
+    def _draw_diffusion_shock(self, scale: float) -> float:
         if self._sigma_eta == 0.0:
             return 0.0
 
-        return self._rng.gauss(0.0, self._sigma_eta * sqrt(dt_sec))
+        return self._rng.gauss(0.0, scale)
 
-    def _draw_jump_shock(self, dt_sec: float) -> float:
+    def _draw_jump_shock(self, lam_dt: float) -> float:
         if not self._jump.enabled:
             return 0.0
 
-        lam_dt = self._jump.intensity_per_second * dt_sec
         jump_count = self._poisson(lam_dt)
         shock = 0.0
         for _ in range(jump_count):
@@ -129,7 +177,10 @@ class BoundedLogOddsLatentProcess(LatentProcess):
         """
         if lam <= 0.0:
             return 0
-        threshold = exp(-lam)
+        if lam != self._poisson_lam:
+            self._poisson_lam = lam
+            self._poisson_threshold = exp(-lam)
+        threshold = self._poisson_threshold
         k = 0
         p = 1.0
         while p > threshold:
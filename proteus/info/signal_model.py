@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
 from bisect import bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from random import Random
 
+# Resolved per-agent observation state: (delay_ms, noise_stddev, bound gauss of the
+# agent's noise stream, or None when the agent observes without noise).
+_Observer = tuple[int, float, Callable[[float, float], float] | None]
+
 
 class SignalModel(ABC):
     """Maps latent truth to an agent-specific observation."""
@@ -55,13 +62,18 @@ class HeterogeneousSignalModel(SignalModel):
     ) -> None:
         self._default = default or AgentSignalConfig()
         self._per_agent = per_agent or {}
-        self._history: list[tuple[int, float]] = []
+        # Truth history as parallel typed columns, non-decreasing in ts.
+        self._history_ts = array("q")
+        self._history_p = array("d")
         self._rng_by_agent: dict[str, Random] = {}
+        self._observers: dict[str, _Observer] = {}
         self._seed = 0
 
     def reset(self, seed: int) -> None:
-        self._history.clear()
+        del self._history_ts[:]
+        del self._history_p[:]
         self._rng_by_agent.clear()
+        self._observers.clear()
         self._seed = seed
 
     def observe(self, agent_id: str, ts_ms: int, p_t: float) -> float:
@@ -70,39 +82,54 @@ class HeterogeneousSignalModel(SignalModel):
             raise ValueError("ts_ms must be non-negative")
         self._record_truth(ts_ms, clipped_p)
 
-        cfg = self._per_agent.get(agent_id, self._default)
-        source_p = self._lookup_delayed_p(ts_ms=ts_ms, delay_ms=cfg.delay_ms)
-        if cfg.noise_stddev == 0.0:
+        observer = self._observers.get(agent_id)
+        if observer is None:
+            observer = self._observers[agent_id] = self._build_observer(agent_id)
+        delay_ms, noise_stddev, gauss = observer
+
+        source_p = self._lookup_delayed_p(ts_ms=ts_ms, delay_ms=delay_ms)
+        if gauss is None:
             return source_p
+        return _clip_probability(source_p + gauss(0.0, noise_stddev))
 
-        rng = self._rng_by_agent.setdefault(agent_id, Random(_seed_for_agent(self._seed, agent_id)))
-        noisy = source_p + rng.gauss(0.0, cfg.noise_stddev)
-        return _clip_probability(noisy)
+    def _build_observer(self, agent_id: str) -> _Observer:
+        cfg = self._per_agent.get(agent_id, self._default)
+        if cfg.noise_stddev == 0.0:
+            return (cfg.delay_ms, 0.0, None)
+        rng = self._rng_by_agent.get(agent_id)
+        if rng is None:
+            rng = self._rng_by_agent[agent_id] = Random(_seed_for_agent(self._seed, agent_id))
+        return (cfg.delay_ms, cfg.noise_stddev, rng.gauss)
 
     def _record_truth(self, ts_ms: int, p_t: float) -> None:
-        if self._history and ts_ms < self._history[-1][0]:
-            raise ValueError("observe calls must be non-decreasing in ts_ms")
-        if self._history and ts_ms == self._history[-1][0]:
-            self._history[-1] = (ts_ms, p_t)
-            return
-        self._history.append((ts_ms, p_t))
+        history_ts = self._history_ts
+        if history_ts:
+            last_ts = history_ts[-1]
+            if ts_ms < last_ts:
+                raise ValueError("observe calls must be non-decreasing in ts_ms")
+            if ts_ms == last_ts:
+                self._history_p[-1] = p_t
+                return
+        history_ts.append(ts_ms)
+        self._history_p.append(p_t)
 
     def _lookup_delayed_p(self, *, ts_ms: int, delay_ms: int) -> float:
-        if not self._history:
+        history_ts = self._history_ts
+        if not history_ts:
             raise ValueError("signal history is empty")
         target_ts = ts_ms - delay_ms
-        if target_ts <= self._history[0][0]:
-            return self._history[0][1]
+        if target_ts <= history_ts[0]:
+            return self._history_p[0]
 
-        ts_values = [ts for ts, _ in self._history]
-        idx = bisect_right(ts_values, target_ts) - 1
-        return self._history[idx][1]
+        idx = bisect_right(history_ts, target_ts) - 1
+        return self._history_p[idx]
 
 
 def _clip_probability(value: float) -> float:
     return min(1.0, max(0.0, value))
 
 
+@lru_cache(maxsize=1024)
 def _seed_for_agent(seed: int, agent_id: str) -> int:
     acc = seed
     for char in agent_id:
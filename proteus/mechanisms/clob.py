@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import heapq
+from bisect import insort
 from collections import deque
 from dataclasses import dataclass
-from math import isfinite
+from math import inf
 
 from proteus.core.events import CancelIntent, Fill, OrderIntent, Side
 from proteus.mechanisms.base import Mechanism
 
 
-@dataclass
+@dataclass(slots=True)
 class _BookOrder:
     order_id: str
     agent_id: str
@@ -32,8 +32,8 @@ class CLOBMechanism(Mechanism):
     def __init__(self) -> None:
         self._bids: dict[float, deque[_BookOrder]] = {}  # price level queues
         self._asks: dict[float, deque[_BookOrder]] = {}  # price level queues
-        self._bid_heap: list[float] = []  # max-heap using negative prices
-        self._ask_heap: list[float] = []  # min-heap
+        self._bid_prices: list[float] = []  # ascending; best bid last
+        self._ask_keys: list[float] = []  # negated ask prices ascending; best ask last
         self._orders_by_id: dict[str, _BookOrder] = {}
         self._next_order_seq = 1
         self._next_fill_seq = 1
@@ -59,13 +59,13 @@ class CLOBMechanism(Mechanism):
         if order.side is Side.BUY:
             level = self._bids.setdefault(order.price, deque())
             if len(level) == 0:
-                heapq.heappush(self._bid_heap, -order.price)
+                insort(self._bid_prices, order.price)
             level.append(order)
             return
 
         level = self._asks.setdefault(order.price, deque())
         if len(level) == 0:
-            heapq.heappush(self._ask_heap, order.price)
+            insort(self._ask_keys, -order.price)
         level.append(order)
 
     def cancel(self, intent: CancelIntent) -> None:
@@ -80,19 +80,22 @@ class CLOBMechanism(Mechanism):
         if ts_ms < 0:
             raise ValueError("ts_ms must be non-negative")
 
+        best_bid_of = self._best_bid
+        best_ask_of = self._best_ask
+        consume_depleted = self._consume_depleted
         fills: list[Fill] = []
         while True:
-            best_bid = self._best_bid()
-            best_ask = self._best_ask()
-            if best_bid is None or best_ask is None:
+            best_bid = best_bid_of()
+            if best_bid is None:
                 break
-            if best_bid.price < best_ask.price:
+            best_ask = best_ask_of()
+            if best_ask is None or best_bid.price < best_ask.price:
                 break
 
             size = min(best_bid.remaining_size, best_ask.remaining_size)
             if size <= 0.0:
-                self._consume_depleted(best_bid)
-                self._consume_depleted(best_ask)
+                consume_depleted(best_bid)
+                consume_depleted(best_ask)
                 continue
 
             fill = Fill(
@@ -110,29 +113,29 @@ class CLOBMechanism(Mechanism):
             best_bid.remaining_size -= size
             best_ask.remaining_size -= size
 
-            self._consume_depleted(best_bid)
-            self._consume_depleted(best_ask)
+            consume_depleted(best_bid)
+            consume_depleted(best_ask)
 
         return fills
 
     def _best_bid(self) -> _BookOrder | None:
-        return self._best_order(heap=self._bid_heap, levels=self._bids, is_bid=True)
+        return self._best_order(prices=self._bid_prices, levels=self._bids, is_bid=True)
 
     def _best_ask(self) -> _BookOrder | None:
-        return self._best_order(heap=self._ask_heap, levels=self._asks, is_bid=False)
+        return self._best_order(prices=self._ask_keys, levels=self._asks, is_bid=False)
 
     def _best_order(
         self,
         *,
-        heap: list[float],
+        prices: list[float],
         levels: dict[float, deque[_BookOrder]],
         is_bid: bool,
     ) -> _BookOrder | None:
-        while heap:
-            price_key = -heap[0] if is_bid else heap[0]
+        while prices:
+            price_key = prices[-1] if is_bid else -prices[-1]
             level = levels.get(price_key)
             if level is None or len(level) == 0:
-                heapq.heappop(heap)
+                prices.pop()
                 if price_key in levels:
                     del levels[price_key]
                 continue
@@ -142,7 +145,7 @@ class CLOBMechanism(Mechanism):
                 self._orders_by_id.pop(head.order_id, None)
 
             if not level:
-                heapq.heappop(heap)
+                prices.pop()
                 del levels[price_key]
                 continue
 
@@ -163,7 +166,8 @@ class CLOBMechanism(Mechanism):
     def _validate_order_intent(intent: OrderIntent) -> None:
         if intent.ts_ms < 0:
             raise ValueError("ts_ms must be non-negative")
-        if not isfinite(intent.price) or intent.price < 0.0 or intent.price > 1.0:
+        # Chained comparisons are False for NaN, so they double as the finiteness check.
+        if not 0.0 <= intent.price <= 1.0:
             raise ValueError("price must be finite and in [0,1]")
-        if not isfinite(intent.size) or intent.size <= 0.0:
+        if not 0.0 < intent.size < inf:
             raise ValueError("size must be finite and > 0")
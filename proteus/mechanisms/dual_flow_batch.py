@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import isfinite
+from math import inf
 
 from proteus.core.events import CancelIntent, Fill, OrderIntent, Side
 from proteus.mechanisms.base import Mechanism
@@ -257,7 +257,8 @@ class DualFlowBatchMechanism(Mechanism):
     def _validate_order_intent(intent: OrderIntent) -> None:
         if intent.ts_ms < 0:
             raise ValueError("ts_ms must be non-negative")
-        if not isfinite(intent.price) or not (0.0 <= intent.price <= 1.0):
+        # Chained comparisons are False for NaN, so they double as the finiteness check.
+        if not 0.0 <= intent.price <= 1.0:
             raise ValueError("price must be finite and in [0,1]")
-        if not isfinite(intent.size) or intent.size <= 0.0:
+        if not 0.0 < intent.size < inf:
             raise ValueError("size must be finite and > 0")
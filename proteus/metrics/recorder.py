@@ -4,20 +4,29 @@ from __future__ import annotations
 
 import csv
 import json
-from dataclasses import asdict, dataclass, field
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
+from itertools import accumulate, chain, islice
 from math import isfinite, nan, sqrt
+from operator import le, sub
 from pathlib import Path
 from statistics import mean, pstdev, pvariance
-from typing import Any
+from typing import Any, TypeVar
 
 from proteus.agents.base import AgentDecisionDiagnostic
 from proteus.core.accounting import AccountingEngine
 from proteus.core.events import Event, EventType, Fill
 from proteus.metrics.research_metrics import compute_research_stub_metrics
 
+ItemT = TypeVar("ItemT")
+
 SCHEMA_VERSION = "1.1.0"
 
+# json.dumps builds a fresh encoder whenever options are passed; share one for JSONL rows.
+_JSONL_ENCODER = json.JSONEncoder(sort_keys=True)
+
 NON_NEGOTIABLE_METRICS: tuple[str, ...] = (
     "mm_pnl",
     "mm_sharpe",
@@ -128,8 +137,11 @@ class Recorder:
         fills_path = out_dir / f"{resolved_run_id}_fills.jsonl"
         diagnostics_path = out_dir / f"{resolved_run_id}_agent_diagnostics.jsonl"
 
+        # Shallow field map: rows are already plain dicts, so asdict's deep copy buys nothing.
+        bundle_payload = {item.name: getattr(bundle, item.name) for item in fields(bundle)}
         bundle_path.write_text(
-            json.dumps(asdict(bundle), indent=2, sort_keys=True), encoding="utf-8"
+            json.dumps(bundle_payload, indent=2, sort_keys=True),
+            encoding="utf-8",
         )
         metrics_path.write_text(
             json.dumps(bundle.metrics, indent=2, sort_keys=True), encoding="utf-8"
@@ -164,9 +176,9 @@ class Recorder:
         if not isfinite(mark_price):
             raise ValueError("mark_price must be finite")
 
-        fills_sorted = sorted(self.fills, key=lambda fill: fill.ts_ms)
-        events_sorted = sorted(
-            self.events, key=lambda event: (event.ts_ms, event.seq_no, event.event_id)
+        fills_sorted = _sorted_by(self.fills, lambda fill: fill.ts_ms)
+        events_sorted = _sorted_by(
+            self.events, lambda event: (event.ts_ms, event.seq_no, event.event_id)
         )
 
         prices = [fill.price for fill in fills_sorted]
@@ -177,22 +189,39 @@ class Recorder:
             )
             metrics["trader_slippage_bps"] = mean(abs(delta) for delta in diffs_to_mark) * 10_000.0
 
-        order_events = [event for event in events_sorted if event.event_type is EventType.ORDER]
+        order_events: list[Event] = []
+        quote_events: list[Event] = []
+        truth_series: list[tuple[int, float]] = []
+        for event in events_sorted:
+            event_type = event.event_type
+            if event_type is EventType.ORDER:
+                order_events.append(event)
+            elif event_type is EventType.QUOTE:
+                quote_events.append(event)
+            elif event_type is EventType.NEWS:
+                raw = event.payload.get("p_t")
+                if isinstance(raw, int | float):
+                    truth_series.append((event.ts_ms, float(raw)))
+
+        participants = {fill.buy_agent_id for fill in fills_sorted}
+        participants.update(fill.sell_agent_id for fill in fills_sorted)
+        mm_agent_ids = frozenset(agent_id for agent_id in participants if _is_mm_agent(agent_id))
+
         if order_events:
             metrics["trader_fill_probability"] = min(1.0, len(fills_sorted) / len(order_events))
 
         metrics["trader_time_to_execution_ms"] = self._mean_time_to_execution_ms(
-            order_events, fills_sorted
+            order_events, fills_sorted, mm_agent_ids
         )
 
-        quote_events = [event for event in events_sorted if event.event_type is EventType.QUOTE]
         metrics["market_spread_mean"] = self._mean_spread(quote_events)
         metrics["market_depth_mean"] = self._mean_depth(quote_events)
         metrics["market_realized_volatility"] = self._realized_volatility(prices)
-        metrics["market_price_rmse"] = self._market_rmse(events_sorted, fills_sorted, mark_price)
+        metrics["market_price_rmse"] = self._market_rmse(truth_series, fills_sorted, mark_price)
         metrics["market_shock_resilience_half_life_ms"] = nan
         mm_metrics = self._compute_mm_metrics(
             fills_sorted=fills_sorted,
+            mm_agent_ids=mm_agent_ids,
             mark_price=mark_price,
             adverse_selection_delta_ms=adverse_selection_delta_ms,
         )
@@ -205,6 +234,7 @@ class Recorder:
         self,
         *,
         fills_sorted: list[Fill],
+        mm_agent_ids: frozenset[str],
         mark_price: float,
         adverse_selection_delta_ms: int,
     ) -> dict[str, float]:
@@ -224,7 +254,7 @@ class Recorder:
             engine.process_fill(fill)
 
         snapshot = engine.snapshot()
-        mm_ids = sorted(agent_id for agent_id in snapshot.accounts if _is_mm_agent(agent_id))
+        mm_ids = sorted(agent_id for agent_id in snapshot.accounts if agent_id in mm_agent_ids)
         if not mm_ids:
             return out
 
@@ -240,9 +270,7 @@ class Recorder:
         )
 
         if len(equity_curve) >= 2:
-            returns = [
-                equity_curve[idx] - equity_curve[idx - 1] for idx in range(1, len(equity_curve))
-            ]
+            returns = list(map(sub, islice(equity_curve, 1, None), equity_curve))
 
             sigma = pstdev(returns) if len(returns) > 1 else 0.0
             out["mm_sharpe"] = (mean(returns) / sigma) if sigma > 0.0 else 0.0
@@ -253,6 +281,7 @@ class Recorder:
 
         out["mm_adverse_selection_loss"] = self._adverse_selection_loss(
             fills_sorted=fills_sorted,
+            mm_agent_ids=mm_agent_ids,
             adverse_selection_delta_ms=adverse_selection_delta_ms,
         )
         return out
@@ -261,25 +290,29 @@ class Recorder:
         self,
         *,
         fills_sorted: list[Fill],
+        mm_agent_ids: frozenset[str],
         adverse_selection_delta_ms: int,
     ) -> float:
         if not fills_sorted:
             return nan
 
         as_loss = 0.0
-        ts_prices = [(fill.ts_ms, fill.price) for fill in fills_sorted]
+        fill_ts = [fill.ts_ms for fill in fills_sorted]
+        fill_prices = [fill.price for fill in fills_sorted]
 
         for fill in fills_sorted:
             q = 0.0
-            if _is_mm_agent(fill.buy_agent_id):
+            if fill.buy_agent_id in mm_agent_ids:
                 q += fill.size
-            if _is_mm_agent(fill.sell_agent_id):
+            if fill.sell_agent_id in mm_agent_ids:
                 q -= fill.size
             if q == 0.0:
                 continue
 
             future_ts = fill.ts_ms + adverse_selection_delta_ms
-            p_future = _latest_price_at_or_after(ts_prices, future_ts, fallback=fill.price)
+            p_future = _latest_price_at_or_after(
+                fill_ts, fill_prices, future_ts, fallback=fill.price
+            )
             as_loss += q * (p_future - fill.price)
 
         return as_loss
@@ -291,35 +324,56 @@ class Recorder:
         mm_ids: list[str],
         mark_price: float,
     ) -> list[float]:
-        engine = AccountingEngine()
+        # Only mm rows feed the curve, so replay just those with the engine's own update order
+        # instead of re-marking every account per fill.
+        cash = dict.fromkeys(mm_ids, 0.0)
+        inventory = dict.fromkeys(mm_ids, 0.0)
         curve: list[float] = []
         for fill in fills_sorted:
-            engine.process_fill(fill)
-            mtm = engine.mark_to_market(mark_price)
-            curve.append(sum(mtm.get(agent_id, 0.0) for agent_id in mm_ids))
+            price = fill.price
+            size = fill.size
+            # Mirrors AccountingEngine._validate_fill: rejected fills leave the ledger untouched.
+            if 0.0 <= price <= 1.0 and 0.0 < size and isfinite(size):
+                notional = price * size
+                buyer = fill.buy_agent_id
+                seller = fill.sell_agent_id
+                if buyer in cash:
+                    cash[buyer] += -notional
+                if seller in cash:
+                    cash[seller] += notional
+                if buyer in inventory:
+                    inventory[buyer] += size
+                if seller in inventory:
+                    inventory[seller] += -size
+            curve.append(
+                sum(cash[agent_id] + (inventory[agent_id] * mark_price) for agent_id in mm_ids)
+            )
         return curve
 
     def _mean_time_to_execution_ms(
         self,
         order_events: list[Event],
         fills_sorted: list[Fill],
+        mm_agent_ids: frozenset[str],
     ) -> float:
+        # Inputs are time-sorted, so setdefault keeps each agent's first timestamp.
         first_order_ts: dict[str, int] = {}
         for event in order_events:
             agent_id = _extract_agent_id(event)
-            if agent_id is not None and agent_id not in first_order_ts:
-                first_order_ts[agent_id] = event.ts_ms
+            if agent_id is not None:
+                first_order_ts.setdefault(agent_id, event.ts_ms)
 
         first_fill_ts: dict[str, int] = {}
         for fill in fills_sorted:
-            for agent_id in (fill.buy_agent_id, fill.sell_agent_id):
-                if not _is_mm_agent(agent_id) and agent_id not in first_fill_ts:
-                    first_fill_ts[agent_id] = fill.ts_ms
+            first_fill_ts.setdefault(fill.buy_agent_id, fill.ts_ms)
+            first_fill_ts.setdefault(fill.sell_agent_id, fill.ts_ms)
 
         delays = [
-            first_fill_ts[agent_id] - first_order_ts[agent_id]
-            for agent_id in first_fill_ts
-            if agent_id in first_order_ts and first_fill_ts[agent_id] >= first_order_ts[agent_id]
+            fill_ts - order_ts
+            for agent_id, fill_ts in first_fill_ts.items()
+            if agent_id not in mm_agent_ids
+            and (order_ts := first_order_ts.get(agent_id)) is not None
+            and fill_ts >= order_ts
         ]
         if not delays:
             return nan
@@ -327,23 +381,20 @@ class Recorder:
 
     def _market_rmse(
         self,
-        events_sorted: list[Event],
+        truth_series: list[tuple[int, float]],
         fills_sorted: list[Fill],
         mark_price: float,
     ) -> float:
         if not fills_sorted:
             return nan
 
-        truth_series: list[tuple[int, float]] = []
-        for event in events_sorted:
-            if event.event_type is EventType.NEWS:
-                raw = event.payload.get("p_t")
-                if isinstance(raw, int | float):
-                    truth_series.append((event.ts_ms, float(raw)))
-
+        truth_ts = [truth_ts for truth_ts, _ in truth_series]
+        truth_values = [truth_val for _, truth_val in truth_series]
         errors: list[float] = []
         for fill in fills_sorted:
-            truth = _latest_truth_at_or_before(truth_series, fill.ts_ms, fallback=mark_price)
+            truth = _latest_truth_at_or_before(
+                truth_ts, truth_values, fill.ts_ms, fallback=mark_price
+            )
             errors.append((fill.price - truth) ** 2)
 
         return sqrt(mean(errors)) if errors else nan
@@ -374,7 +425,7 @@ class Recorder:
     def _realized_volatility(self, prices: list[float]) -> float:
         if len(prices) < 2:
             return nan
-        returns = [prices[idx] - prices[idx - 1] for idx in range(1, len(prices))]
+        returns = list(map(sub, islice(prices, 1, None), prices))
         if len(returns) == 1:
             return abs(returns[0])
         return pstdev(returns)
@@ -413,15 +464,14 @@ class Recorder:
 
     def _write_summary_csv(self, path: Path, rows: list[dict[str, float]]) -> None:
         with path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=["metric", "value"])
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(handle)
+            writer.writerow(("metric", "value"))
+            writer.writerows((row["metric"], row["value"]) for row in rows)
 
     def _write_jsonl(self, path: Path, rows: list[dict[str, Any]]) -> None:
+        encode = _JSONL_ENCODER.encode
         with path.open("w", encoding="utf-8") as handle:
-            for row in rows:
-                handle.write(json.dumps(row, sort_keys=True))
-                handle.write("\n")
+            handle.writelines(f"{encode(row)}\n" for row in rows)
 
     def _write_parquet(
         self,
@@ -436,8 +486,8 @@ class Recorder:
 
         events_path = out_dir / f"{run_id}_events.parquet"
         fills_path = out_dir / f"{run_id}_fills.parquet"
-        pd.DataFrame(bundle.event_log).to_parquet(events_path, index=False)
-        pd.DataFrame(bundle.fills).to_parquet(fills_path, index=False)
+        pd.DataFrame(_rows_to_columns(bundle.event_log)).to_parquet(events_path, index=False)
+        pd.DataFrame(_rows_to_columns(bundle.fills)).to_parquet(fills_path, index=False)
 
         return {"events_parquet": events_path, "fills_parquet": fills_path}
 
@@ -446,6 +496,22 @@ def _is_mm_agent(agent_id: str) -> bool:
     return agent_id.startswith("mm")
 
 
+def _sorted_by(items: list[ItemT], key: Callable[[ItemT], Any]) -> list[ItemT]:
+    # recorders usually receive items in order; skip the copy and sort when they already are
+    keys = list(map(key, items))
+    if all(map(le, keys, islice(keys, 1, None))):
+        return items
+    order = sorted(range(len(items)), key=keys.__getitem__)
+    return [items[idx] for idx in order]
+
+
+def _rows_to_columns(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    # serialized rows share one key order, so columns can be cut without per-row inference
+    if not rows:
+        return {}
+    return {key: [row[key] for row in rows] for key in rows[0]}
+
+
 def _extract_agent_id(event: Event) -> str | None:
     direct = event.payload.get("agent_id")
     if isinstance(direct, str):
@@ -461,41 +527,32 @@ def _extract_agent_id(event: Event) -> str | None:
 
 
 def _latest_truth_at_or_before(
-    truth_series: list[tuple[int, float]],
+    truth_ts: list[int],
+    truth_values: list[float],
     ts_ms: int,
     fallback: float,
 ) -> float:
-    if not truth_series:
+    if not truth_values:
         return fallback
-
-    candidate = truth_series[0][1]
-    for truth_ts, truth_val in truth_series:
-        if truth_ts > ts_ms:
-            break
-        candidate = truth_val
-    return candidate
+    # samples after ts_ms fall back to the first sample, not to the mark price
+    idx = bisect_right(truth_ts, ts_ms) - 1
+    return truth_values[max(idx, 0)]
 
 
 def _latest_price_at_or_after(
-    ts_prices: list[tuple[int, float]],
+    price_ts: list[int],
+    prices: list[float],
     ts_ms: int,
     fallback: float,
 ) -> float:
-    for price_ts, price in ts_prices:
-        if price_ts >= ts_ms:
-            return price
-    return fallback
+    idx = bisect_left(price_ts, ts_ms)
+    if idx == len(prices):
+        return fallback
+    return prices[idx]
 
 
 def _max_drawdown(curve: list[float]) -> float:
     if not curve:
         return nan
-    peak = curve[0]
-    max_dd = 0.0
-    for value in curve:
-        if value > peak:
-            peak = value
-        dd = peak - value
-        if dd > max_dd:
-            max_dd = dd
-    return max_dd
+    # max() keeps its running value unless an item is strictly greater, as the loop form did
+    return max(chain((0.0,), map(sub, accumulate(curve, max), curve)))
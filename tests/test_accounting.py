@@ -70,3 +70,78 @@ def test_accounting_reports_fill_id_for_invalid_size() -> None:
     violation = snapshot.violations[0]
     assert violation.event_id == "bad-size"
     assert violation.code == "invalid_fill_size"
+    assert violation.message == "fill size must be > 0, got 0.0"
+
+
+def test_accounting_running_totals_match_accounts_and_reset() -> None:
+    engine = AccountingEngine()
+    agents = ("a", "b", "c", "d")
+    fills = [
+        Fill(
+            fill_id=f"f-{i}",
+            ts_ms=i,
+            buy_agent_id=agents[i % 4],
+            sell_agent_id=agents[(i + 1) % 4],
+            price=0.1 + (0.05 * (i % 15)),
+            size=0.5 + (i % 3),
+        )
+        for i in range(50)
+    ]
+    snapshot = engine.process_fills(fills)
+
+    assert snapshot.violations == []
+    accounts = snapshot.accounts.values()
+    assert abs(snapshot.total_cash - sum(a.cash for a in accounts)) <= 1e-9
+    assert abs(snapshot.total_inventory - sum(a.inventory for a in accounts)) <= 1e-9
+    assert abs(snapshot.total_cash) <= 1e-9
+    assert abs(snapshot.total_inventory) <= 1e-9
+
+    engine.reset()
+    cleared = engine.snapshot()
+    assert cleared.accounts == {}
+    assert cleared.total_cash == 0.0
+    assert cleared.total_inventory == 0.0
+    assert cleared.processed_fills == 0
+
+
+def test_accounting_batch_matches_per_fill_processing() -> None:
+    fills = [
+        Fill(fill_id="f-1", ts_ms=1, buy_agent_id="a", sell_agent_id="b", price=0.4, size=2.0),
+        Fill(fill_id="f-2", ts_ms=2, buy_agent_id="b", sell_agent_id="a", price=1.5, size=1.0),
+        Fill(
+            fill_id="f-3",
+            ts_ms=3,
+            buy_agent_id="c",
+            sell_agent_id="a",
+            price=float("nan"),
+            size=1.0,
+        ),
+        Fill(fill_id="f-4", ts_ms=4, buy_agent_id="c", sell_agent_id="b", price=0.7, size=-1.0),
+        Fill(
+            fill_id="f-5",
+            ts_ms=5,
+            buy_agent_id="c",
+            sell_agent_id="b",
+            price=0.7,
+            size=float("inf"),
+        ),
+        Fill(fill_id="f-6", ts_ms=6, buy_agent_id="c", sell_agent_id="a", price=0.3, size=3.0),
+    ]
+
+    batched = AccountingEngine()
+    batch_snapshot = batched.process_fills(fills)
+
+    single = AccountingEngine()
+    for fill in fills:
+        single.process_fill(fill)
+    single_snapshot = single.snapshot()
+
+    assert batch_snapshot == single_snapshot
+    assert batch_snapshot.processed_fills == 2
+    assert [v.code for v in batch_snapshot.violations] == [
+        "invalid_fill_price",
+        "invalid_fill_price",
+        "invalid_fill_size",
+        "invalid_fill_size",
+    ]
+    assert batched.settlement_pnl(1.0) == single.settlement_pnl(1.0)
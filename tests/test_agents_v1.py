@@ -106,3 +106,93 @@ def test_noise_trader_poisson_arrivals_are_seed_deterministic() -> None:
     for _, price, size in observed_a:
         assert 0.0 <= price <= 1.0
         assert 0.25 <= size <= 2.0
+
+
+def test_noise_trader_high_intensity_arrivals_match_poisson_moments() -> None:
+    agent = NoiseTraderAgent("noise-hi", arrival_rate_per_second=400.0, seed=11)
+    agent.generate_intents(ts_ms=0)
+
+    # 100ms steps at 400/s -> lam = 40 per step, above the PTRS switch-over.
+    counts = [len(agent.generate_intents(ts_ms=100 * step)) for step in range(1, 2001)]
+    sample_mean = sum(counts) / len(counts)
+    sample_var = sum((c - sample_mean) ** 2 for c in counts) / len(counts)
+
+    assert abs(sample_mean - 40.0) < 1.0
+    assert abs(sample_var - 40.0) < 6.0
+    assert min(counts) >= 0
+
+
+def test_market_maker_vol_estimate_decays_on_stale_mid() -> None:
+    mm = MarketMakerAgent("mm-1", belief_init=0.5, b_vol_spread=1.0)
+
+    def quote(ts_ms: int, mid: float) -> None:
+        mm.on_event(
+            Event(
+                event_id=f"q{ts_ms}",
+                ts_ms=ts_ms,
+                event_type=EventType.QUOTE,
+                payload={"best_bid": mid - 0.01, "best_ask": mid + 0.01},
+            )
+        )
+
+    def spread(ts_ms: int) -> float:
+        intents = list(mm.generate_intents(ts_ms=ts_ms))
+        bid = next(i for i in intents if i.side is Side.BUY)
+        ask = next(i for i in intents if i.side is Side.SELL)
+        return ask.price - bid.price
+
+    quote(1, 0.50)
+    calm = spread(2)
+    quote(3, 0.60)
+    shocked = spread(4)
+    assert shocked > calm
+
+    previous = shocked
+    for ts in range(5, 25, 2):
+        quote(ts, 0.60)
+        current = spread(ts + 1)
+        assert current < previous
+        previous = current
+    assert previous - calm < 0.25 * (shocked - calm)
+
+
+def test_noise_trader_default_seed_is_stable_per_agent_id() -> None:
+    def draws(agent_id: str) -> list[tuple[str, float, float]]:
+        agent = NoiseTraderAgent(agent_id, arrival_rate_per_second=20.0)
+        return [
+            (intent.side.value, intent.price, intent.size)
+            for ts in range(0, 2_000, 100)
+            for intent in agent.generate_intents(ts_ms=ts)
+        ]
+
+    assert draws("noise-1") == draws("noise-1")
+    assert draws("noise-1") != draws("noise-2")
+
+
+def test_market_maker_quotes_only_reducing_side_at_inventory_limit() -> None:
+    def fill(mm: MarketMakerAgent, ts_ms: int, *, buy: bool, size: float) -> None:
+        mm.on_event(
+            Event(
+                event_id=f"f{ts_ms}",
+                ts_ms=ts_ms,
+                event_type=EventType.FILL,
+                payload={
+                    "buy_agent_id": "mm-1" if buy else "other",
+                    "sell_agent_id": "other" if buy else "mm-1",
+                    "size": size,
+                    "price": 0.5,
+                },
+            )
+        )
+
+    long_mm = MarketMakerAgent("mm-1", max_inventory=5.0)
+    fill(long_mm, 1, buy=True, size=5.0)
+    assert [i.side for i in long_mm.generate_intents(ts_ms=2)] == [Side.SELL]
+
+    short_mm = MarketMakerAgent("mm-1", max_inventory=5.0)
+    fill(short_mm, 1, buy=False, size=6.0)
+    assert [i.side for i in short_mm.generate_intents(ts_ms=2)] == [Side.BUY]
+
+    flat_mm = MarketMakerAgent("mm-1", max_inventory=5.0)
+    fill(flat_mm, 1, buy=True, size=4.0)
+    assert [i.side for i in flat_mm.generate_intents(ts_ms=2)] == [Side.BUY, Side.SELL]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import csv
 import json
+from dataclasses import replace
 
 import pytest
 
@@ -207,3 +208,22 @@ def test_baseline_pack_invalid_config_raises(tmp_path, field, value) -> None:
     kwargs[field] = value
     with pytest.raises(ValueError):
         run_clob_baseline_pack(BaselinePackConfig(**kwargs), out_dir=tmp_path)
+
+
+def test_baseline_pack_outputs_match_across_worker_counts(tmp_path) -> None:
+    base = BaselinePackConfig(
+        base_seed=7,
+        repetitions=2,
+        duration_ms=800,
+        step_ms=100,
+        informed_activity_grid=(0.04, 0.08),
+        latency_submission_grid_ms=(1, 250),
+    )
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+    run_clob_baseline_pack(base, out_dir=serial_dir)
+    run_clob_baseline_pack(replace(base, workers=2), out_dir=parallel_dir)
+
+    for name in ("clob_baseline_pack_report.json", "clob_baseline_pack_summary.csv"):
+        serial = (serial_dir / name).read_text(encoding="utf-8")
+        assert serial == (parallel_dir / name).read_text(encoding="utf-8")
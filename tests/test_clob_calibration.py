@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 
 from proteus.experiments.calibration import (
     CalibrationSearchConfig,
     CandidateRegime,
+    SurvivalCriteria,
+    _simulate_one,
     run_clob_calibration,
     simulate_clob_regime,
 )
@@ -69,3 +72,43 @@ def test_large_submission_latency_changes_simulation_outputs() -> None:
 
     assert low_latency.mm_pnl != high_latency.mm_pnl
     assert low_latency.market_spread_mean != high_latency.market_spread_mean
+
+
+def test_calibration_report_matches_across_worker_counts(tmp_path) -> None:
+    config = CalibrationSearchConfig(
+        seeds=(7, 11),
+        duration_ms=1_000,
+        step_ms=100,
+        mm_h0_grid=(0.01, 0.015),
+        mm_kappa_grid=(0.004,),
+        mm_min_half_spread_grid=(0.0025, 0.0035),
+        informed_activity_grid=(0.04, 0.08),
+        latency_submission_grid_ms=(1, 5),
+    )
+    serial = run_clob_calibration(config, out_dir=tmp_path / "serial")
+    parallel = run_clob_calibration(replace(config, workers=2), out_dir=tmp_path / "parallel")
+
+    assert parallel.selected_regime == serial.selected_regime
+    assert parallel.baseline_summary == serial.baseline_summary
+    assert parallel.sensitivity_rows == serial.sensitivity_rows
+    assert parallel.stable_candidates_found == serial.stable_candidates_found
+
+
+def test_repeated_simulation_reuses_cached_run() -> None:
+    regime = CandidateRegime(h0=0.012, kappa_inventory=0.004, min_half_spread=0.002)
+    kwargs = dict(
+        seed=11,
+        duration_ms=1_000,
+        step_ms=100,
+        regime=regime,
+        informed_activity_prob=0.06,
+        submission_latency_ms=25,
+    )
+
+    first = simulate_clob_regime(**kwargs)
+    hits_before = _simulate_one.cache_info().hits
+    second = simulate_clob_regime(**kwargs)
+
+    assert second is first
+    assert _simulate_one.cache_info().hits == hits_before + 1
+    assert first == _simulate_one.__wrapped__(criteria=SurvivalCriteria(), **kwargs)
@@ -100,6 +100,27 @@ def test_crossed_book_clears_until_uncrossed() -> None:
     assert fills[1].price == 0.60
 
 
+def test_levels_walk_in_price_order_after_emptying_and_reopening() -> None:
+    clob = CLOBMechanism()
+    clob.submit(_order("s1", "noise-1", Side.SELL, 0.52, 1.0, 1))
+    clob.submit(_order("s2", "noise-2", Side.SELL, 0.48, 1.0, 2))
+    clob.submit(_order("s3", "noise-3", Side.SELL, 0.50, 1.0, 3))
+    clob.cancel(CancelIntent(intent_id="c1", agent_id="noise-2", ts_ms=4, order_id="s2"))
+    clob.submit(_order("b1", "mm-1", Side.BUY, 0.55, 1.0, 5))
+
+    first = clob.clear(ts_ms=5)
+    assert [(f.sell_agent_id, f.price) for f in first] == [("noise-3", 0.50)]
+
+    clob.submit(_order("s4", "noise-4", Side.SELL, 0.50, 1.0, 6))
+    clob.submit(_order("b2", "mm-2", Side.BUY, 0.60, 3.0, 7))
+
+    second = clob.clear(ts_ms=7)
+    assert [(f.sell_agent_id, f.price) for f in second] == [
+        ("noise-4", 0.50),
+        ("noise-1", 0.52),
+    ]
+
+
 def test_invalid_order_values_raise() -> None:
     clob = CLOBMechanism()
     try:
@@ -113,3 +134,10 @@ def test_invalid_order_values_raise() -> None:
         assert False, "expected ValueError"
     except ValueError:
         pass
+
+    for bad_id, price, size in (("bad3", float("nan"), 1.0), ("bad4", 0.5, float("inf"))):
+        try:
+            clob.submit(_order(bad_id, "mm-1", Side.BUY, price, size, 0))
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
@@ -8,6 +8,8 @@ from proteus.execution.latency import (
     build_default_latency_model,
 )
 from proteus.execution.leakage import (
+    MechanismLeakagePolicy,
+    MechanismLeakageSpec,
     PublicTapeLeakagePolicy,
     build_default_leakage_policy,
     build_rfq_private_leakage_policy,
@@ -19,6 +21,7 @@ def test_constant_latency_model_includes_ack() -> None:
     assert model.submission_delay_ms("clob") == 2
     assert model.ack_delay_ms("clob") == 3
     assert model.fill_delay_ms("clob") == 5
+    assert (model.submission_ms, model.ack_ms, model.fill_ms) == (2, 3, 5)
 
 
 def test_configurable_latency_model_reproducible_with_seed() -> None:
@@ -110,3 +113,18 @@ def test_rfq_private_policy_filters_private_event_fields() -> None:
     assert "ttl_ms" in visible
     assert "dealer_id" in visible
     assert "internal_score" not in visible
+
+
+def test_empty_field_allowance_is_visible_only_to_fill_participants() -> None:
+    event = Event(
+        event_id="f1",
+        ts_ms=5,
+        event_type=EventType.FILL,
+        payload={"price": 0.5, "size": 1.0, "buy_agent_id": "a", "sell_agent_id": "b"},
+    )
+    spec = MechanismLeakageSpec(selective_payload_fields={EventType.FILL: frozenset()})
+    policy = MechanismLeakagePolicy(default_spec=spec)
+    assert policy.is_visible(event, "a")
+    assert policy.is_visible(event, "b")
+    assert not policy.is_visible(event, "c")
+    assert policy.visible_payload(event, "a") == {}
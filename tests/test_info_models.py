@@ -60,3 +60,23 @@ def test_signal_model_delay_and_noise_heterogeneity() -> None:
     assert noisy_obs != [0.10, 0.30, 0.90]
     for obs in noisy_obs:
         assert 0.0 <= obs <= 1.0
+
+
+def test_latent_path_matches_successive_steps_draw_for_draw() -> None:
+    def build() -> BoundedLogOddsLatentProcess:
+        process = BoundedLogOddsLatentProcess(
+            p0=0.4,
+            phi=0.99,
+            sigma_eta=0.3,
+            jump=JumpConfig(intensity_per_second=4.0, mean=0.1, stddev=0.2),
+        )
+        process.reset(seed=21)
+        return process
+
+    stepped = build()
+    expected = [stepped.step(delta_ms=100) for _ in range(50)]
+    expected.append(stepped.step(delta_ms=100))
+
+    pathed = build()
+    assert pathed.path(delta_ms=100, n_steps=50) == expected[:50]
+    assert pathed.step(delta_ms=100) == expected[50]
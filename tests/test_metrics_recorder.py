@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import json
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
 
 from proteus.agents.base import AgentDecisionDiagnostic
+from proteus.core.accounting import AccountingEngine
 from proteus.core.events import Event, EventType, Fill
 from proteus.experiments.export_bundle import main as export_main
 from proteus.metrics.recorder import NON_NEGOTIABLE_METRICS, SCHEMA_VERSION, Recorder
@@ -96,6 +99,92 @@ def test_bundle_writer_outputs_artifacts(tmp_path: Path) -> None:
     assert outputs["events_jsonl"].exists()
     assert outputs["fills_jsonl"].exists()
     assert outputs["agent_diagnostics_jsonl"].exists()
+    assert outputs["bundle_json"].read_text(encoding="utf-8") == json.dumps(
+        asdict(bundle), indent=2, sort_keys=True
+    )
+
+
+def test_truth_and_future_price_lookups_use_sorted_series() -> None:
+    recorder = Recorder()
+    for event_id, ts_ms, p_t in (("news-1", 5, 0.6), ("news-2", 10, 0.4)):
+        recorder.record(
+            Event(event_id=event_id, ts_ms=ts_ms, event_type=EventType.NEWS, payload={"p_t": p_t})
+        )
+    for fill_id, ts_ms, buyer, seller, price, size in (
+        ("f1", 2, "mm-1", "noise-1", 0.50, 1.0),
+        ("f2", 10, "noise-1", "mm-1", 0.45, 2.0),
+        ("f3", 20, "mm-1", "noise-2", 0.55, 1.0),
+    ):
+        recorder.record_fill(
+            Fill(
+                fill_id=fill_id,
+                ts_ms=ts_ms,
+                buy_agent_id=buyer,
+                sell_agent_id=seller,
+                price=price,
+                size=size,
+            )
+        )
+
+    bundle = recorder.build_bundle(scenario_id="unit_scenario", seed=11, mechanism="clob")
+
+    # f1 precedes every truth sample and is scored against the first one
+    assert bundle.metrics["market_price_rmse"] == pytest.approx((0.035 / 3) ** 0.5)
+    # f3 has no later fill and falls back to its own price
+    assert bundle.metrics["mm_adverse_selection_loss"] == pytest.approx(-0.25)
+
+
+def test_metrics_do_not_depend_on_recording_order() -> None:
+    in_order = _sample_recorder()
+    reversed_order = Recorder(
+        events=list(reversed(in_order.events)),
+        fills=list(reversed(in_order.fills)),
+    )
+
+    expected = in_order.build_bundle(scenario_id="unit_scenario", seed=11, mechanism="clob")
+    shuffled = reversed_order.build_bundle(scenario_id="unit_scenario", seed=11, mechanism="clob")
+
+    assert repr(shuffled.metrics) == repr(expected.metrics)
+
+
+def test_mm_equity_curve_matches_full_engine_replay() -> None:
+    fills = [
+        Fill(
+            fill_id="f1",
+            ts_ms=1,
+            buy_agent_id="mm-1",
+            sell_agent_id="noise-1",
+            price=0.41,
+            size=3.0,
+        ),
+        Fill(
+            fill_id="f2", ts_ms=2, buy_agent_id="inf-1", sell_agent_id="mm-2", price=0.57, size=1.5
+        ),
+        Fill(fill_id="f3", ts_ms=3, buy_agent_id="mm-1", sell_agent_id="mm-2", price=1.5, size=1.0),
+        Fill(
+            fill_id="f4", ts_ms=4, buy_agent_id="mm-2", sell_agent_id="mm-1", price=0.49, size=0.7
+        ),
+        Fill(
+            fill_id="f5",
+            ts_ms=5,
+            buy_agent_id="noise-1",
+            sell_agent_id="mm-1",
+            price=0.33,
+            size=2.1,
+        ),
+    ]
+    mm_ids = ["mm-1", "mm-2"]
+
+    engine = AccountingEngine()
+    expected: list[float] = []
+    for fill in fills:
+        engine.process_fill(fill)
+        mtm = engine.mark_to_market(0.47)
+        expected.append(sum(mtm.get(agent_id, 0.0) for agent_id in mm_ids))
+
+    curve = Recorder()._mm_equity_curve(fills_sorted=fills, mm_ids=mm_ids, mark_price=0.47)
+
+    assert curve == expected
 
 
 def test_recorder_includes_agent_diagnostic_stubs() -> None:
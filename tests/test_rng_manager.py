@@ -1,4 +1,4 @@
-from proteus.core.rng import RNGManager, derive_repetition_seed
+from proteus.core.rng import RNGManager, _hash_to_u64, derive_repetition_seed
 
 
 def _draw_uniforms(rng: RNGManager, stream_name: str, n: int) -> list[float]:
@@ -44,3 +44,10 @@ def test_reset_replays_streams_identically() -> None:
 def test_derive_repetition_seed_is_deterministic_and_distinct() -> None:
     assert derive_repetition_seed(100, 0) == derive_repetition_seed(100, 0)
     assert derive_repetition_seed(100, 0) != derive_repetition_seed(100, 1)
+
+
+def test_child_seed_matches_hash_derivation_and_is_cached() -> None:
+    rng = RNGManager(base_seed=11)
+    assert rng.child_seed("agents.mm-1") == _hash_to_u64("11:agents.mm-1")
+    assert rng.child_seed("agents.mm-1") == _hash_to_u64("11:agents.mm-1")
+    assert rng.child_seed("latent") == _hash_to_u64("11:latent")
@@ -58,6 +58,43 @@ def test_scheduler_cannot_schedule_in_the_past() -> None:
         pass
 
 
+def test_scheduler_matches_reference_order_with_same_ts_rescheduling() -> None:
+    scheduler = EventScheduler()
+    expected: list[tuple[int, int, int, str]] = []
+    for i in range(60):
+        ts_ms = (i * 7) % 11
+        priority = (i * 5) % 3
+        event = scheduler.schedule(
+            Event(event_id=f"e{i}", ts_ms=ts_ms, event_type=EventType.ORDER),
+            priority=priority,
+        )
+        expected.append((ts_ms, priority, event.seq_no, event.event_id))
+
+    popped: list[str] = []
+    first = scheduler.pop_next()
+    assert first is not None
+    popped.append(first.event_id)
+
+    # Scheduling at the current timestamp joins the bucket being drained.
+    late = scheduler.schedule(
+        Event(event_id="late", ts_ms=scheduler.now_ms, event_type=EventType.NEWS),
+        priority=-1,
+    )
+    expected.append((late.ts_ms, -1, late.seq_no, late.event_id))
+
+    while scheduler.has_pending():
+        assert scheduler.peek_next_ts() is not None
+        event = scheduler.pop_next()
+        assert event is not None
+        assert event.ts_ms == scheduler.now_ms
+        popped.append(event.event_id)
+
+    reference = [first.event_id] + [row[3] for row in sorted(expected) if row[3] != first.event_id]
+    assert popped == reference
+    assert scheduler.pop_next() is None
+    assert scheduler.peek_next_ts() is None
+
+
 def test_replay_reconstructs_state_from_unordered_log() -> None:
     events = [
         Event(
@@ -88,3 +125,42 @@ def test_replay_reconstructs_state_from_unordered_log() -> None:
 
     final_state = replay_events(events=events, reducer=reducer, initial_state=0)
     assert final_state == 2
+
+
+def test_schedule_many_matches_sequential_schedule() -> None:
+    def build(i: int) -> Event:
+        return Event(event_id=f"e{i}", ts_ms=5 + (i * 7) % 11, event_type=EventType.ORDER)
+
+    sequential = EventScheduler(start_ms=5)
+    batched = EventScheduler(start_ms=5)
+    for scheduler in (sequential, batched):
+        scheduler.schedule(build(100), priority=2)
+
+    priorities = [(i * 5) % 3 - 1 for i in range(40)]
+    expected = [
+        sequential.schedule(build(i), priority=priority) for i, priority in enumerate(priorities)
+    ]
+    assert batched.schedule_many([build(i) for i in range(40)], priorities) == expected
+
+    popped: list[tuple[Event | None, Event | None]] = []
+    while sequential.has_pending():
+        popped.append((sequential.pop_next(), batched.pop_next()))
+    assert all(left == right for left, right in popped)
+    assert not batched.has_pending()
+
+
+def test_schedule_many_rejects_invalid_batch_atomically() -> None:
+    scheduler = EventScheduler(start_ms=10)
+    batch = [
+        Event(event_id="ok", ts_ms=12, event_type=EventType.ORDER),
+        Event(event_id="late", ts_ms=9, event_type=EventType.ORDER),
+    ]
+    for priorities in (None, [0]):
+        try:
+            scheduler.schedule_many(batch, priorities)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    assert not scheduler.has_pending()
+    assert scheduler.schedule_many([]) == []
+    assert scheduler.schedule(batch[0]).seq_no == 1